@@ -4,15 +4,18 @@ API endpoints for managing projects using the Domain API.
 from fastapi import APIRouter, Depends, HTTPException
 from app.models.project import NewProject
 from app.models.node import NodePosition
-from app.core.manager import CodeGraphManager
+from app.core.manager import CodeGraphManager, code_graph_manager
 from app.db.client import get_db
 from arango.database import StandardDatabase
 
 router = APIRouter()
 
 def get_manager() -> CodeGraphManager:
-    """Dependency to get the CodeGraphManager."""
-    return CodeGraphManager()
+    """
+    Dependency to get the CodeGraphManager. Returns the shared instance so
+    its project cache survives across requests.
+    """
+    return code_graph_manager
 
 @router.post("/projects/", status_code=201)
 def create_project(project: NewProject, manager: CodeGraphManager = Depends(get_manager)):
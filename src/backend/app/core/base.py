@@ -10,6 +10,8 @@ class DomainObject(Generic[M]):
     An abstract base class for domain objects. It wraps a Pydantic model
     and provides convenient access to its core attributes like `id` and `key`.
     """
+    __slots__ = ("model",)
+
     def __init__(self, model: M):
         if not model:
             raise ValueError("DomainObject cannot be initialized with a None model.")
@@ -2,39 +2,35 @@
 Domain objects for code elements like Functions and Classes.
 """
 from __future__ import annotations
+import sys
 from typing import Union
-from .base import DomainObject
+from .base import DomainObject, M
 from .package import Package
 from ..models import node, edges
 from ..db import collections as db
 
-class Function(DomainObject[node.FunctionNode]):
-    """A domain object representing a function."""
-    @property
-    def inputs(self) -> list[dict]:
-        """Returns the list of input parameters."""
-        return self.model.properties.inputs
-    
-    @property
-    def outputs(self) -> list[dict]:
-        """Returns the list of output parameters."""
-        return self.model.properties.outputs
-    
+class CodeElement(DomainObject[M]):
+    """
+    Shared behaviour of functions and classes: both can call other elements
+    and consume imports.
+    """
+    __slots__ = ()
+
     @property
     def name(self) -> str:
-        """Returns the name of the function."""
+        """Returns the name of the element."""
         return self.model.name
     
     @property
     def qname(self) -> str:
-        """Returns the qualified name of the function."""
+        """Returns the qualified name of the element."""
         return self.model.qname
-    
+
     def add_call(
         self, target: Union['Function', 'Class'], position: node.NodePosition
     ):
-        """Creates a 'calls' edge from this function to a target element."""
-        if not isinstance(target, (Function, Class)):
+        """Creates a 'calls' edge from this element to a target element."""
+        if not isinstance(target, _CALL_TARGETS):
             raise TypeError(
                 "Call target must be a Function or Class domain object."
             )
@@ -55,7 +51,7 @@ class Function(DomainObject[node.FunctionNode]):
         alias: str | None = None
     ):
         """Creates a 'uses_import' edge from this element to its dependency."""
-        if not isinstance(target, (Function, Class, Package)):
+        if not isinstance(target, _IMPORT_TARGETS):
             raise TypeError("Import target must be a Function, Class, or Package.")
 
         import_edge = edges.UsesImportEdge(
@@ -69,6 +65,21 @@ class Function(DomainObject[node.FunctionNode]):
         )
         db.uses_import_edges.create(import_edge)
 
+
+class Function(CodeElement[node.FunctionNode]):
+    """A domain object representing a function."""
+    __slots__ = ()
+
+    @property
+    def inputs(self) -> list[dict]:
+        """Returns the list of input parameters."""
+        return self.model.properties.inputs
+    
+    @property
+    def outputs(self) -> list[dict]:
+        """Returns the list of output parameters."""
+        return self.model.properties.outputs
+    
     def add_input(self, name: str, position: node.NodePosition, **kwargs):
         """Adds an input parameter to the function's properties."""
         self.model.properties.inputs.append({
@@ -84,74 +95,40 @@ class Function(DomainObject[node.FunctionNode]):
         db.nodes.update(self.model)
 
     
-class Class(DomainObject[node.ClassNode]):
+class Class(CodeElement[node.ClassNode]):
     """A domain object representing a class."""
-    @property
-    def name(self) -> str:
-        """Returns the name of the class."""
-        return self.model.name
-    
-    @property
-    def qname(self) -> str:
-        """Returns the qualified name of the class."""
-        return self.model.qname
-    
+    __slots__ = ()
+
     def add_method(self, name: str, position: node.NodePosition, **kwargs) -> Function:
         """
         Adds a new method (Function) to this class and links them with an
         'implements' edge.
         """
-        qname = f"{self.model.qname}::{name}"
+        qname = sys.intern(f"{self.model.qname}::{name}")
         func_props = node.FunctionProperties(position=position, **kwargs)
+        func_key = db.nodes.new_key()
         func_node_model = node.FunctionNode(
+            _key=func_key,
             name=name,
             qname=qname,
             node_type="function",
             properties=func_props
         )
-        created_func_node = db.nodes.create(func_node_model)
         implements_edge = edges.ImplementsEdge(
             _from=self.id,
-            _to=created_func_node.id
-        )
-        db.implements_edges.create(implements_edge)
-        return Function(created_func_node)
-
-    def add_call(self, target: Union['Function', 'Class'], position: node.NodePosition):
-        """Creates a 'calls' edge from this class to a target element."""
-        if not isinstance(target, (Function, Class)):
-            raise TypeError("Call target must be a Function or Class domain object.")
-        call_edge_model = edges.CallEdge(
-            _from=self.id,
-            _to=target.id,
-            position=position
+            _to=db.nodes.document_id(func_key)
         )
-        db.calls_edges.create(call_edge_model)
-
-    def uses_import(
-        self,
-        target: Union["Function", "Class", "Package"],
-        target_symbol: str,
-        import_position: node.NodePosition,
-        usage_positions: list[node.NodePosition],
-        alias: str | None = None
-    ):
-        """Creates a 'uses_import' edge from this element to its dependency."""
-        if not isinstance(target, (Function, Class, Package)):
-            raise TypeError("Import target must be a Function, Class, or Package.")
-            
-        import_edge = edges.UsesImportEdge(
-            _from=self.id,
-            _to=target.id,
-            target_symbol=target_symbol,
-            target_qname=target.qname,
-            alias=alias,
-            import_position=import_position,
-            usage_positions=usage_positions
+        created_func_node = db.nodes.create_linked(
+            func_node_model, db.implements_edges, implements_edge
         )
-        db.uses_import_edges.create(import_edge)
+        return Function(created_func_node)
 
     def add_field(self, name: str, position: node.NodePosition, **kwargs):
         """Adds a field to the class's properties."""
         self.model.properties.fields.append({"name": name, "position": position, **kwargs})
         db.nodes.update(self.model)
+
+
+# Built once rather than per call for the isinstance checks above
+_CALL_TARGETS = (Function, Class)
+_IMPORT_TARGETS = (Function, Class, Package)
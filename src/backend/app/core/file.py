@@ -1,7 +1,8 @@
 """
 The File domain object.
 """
-from typing import List
+import sys
+from typing import List, Tuple
 from .base import DomainObject
 from .code_elements import Function, Class
 from ..models import node, edges, properties
@@ -13,6 +14,13 @@ class File(DomainObject[node.FileNode]):
     A domain object representing a file, which contains code elements like
     functions, classes, and imports.
     """
+    __slots__ = ("_qname_prefix",)
+
+    def __init__(self, model: node.FileNode):
+        super().__init__(model)
+        # Every declared element's qname starts with this, built once
+        self._qname_prefix = f"{model.qname}."
+
     @property
     def name(self) -> str:
         return self.model.name
@@ -29,27 +37,30 @@ class File(DomainObject[node.FileNode]):
         self, name: str, position: node.NodePosition, **kwargs
     ) -> Function:
         """Adds a new function to this file."""
-        # Use the file's qname as base and append function name
-        file_qname = self.model.qname
-        qname = f"{file_qname}.{name}"
+        # Use the file's qname as base and append function name; interned
+        # since qnames are used as lookup keys throughout the graph
+        qname = sys.intern(self._qname_prefix + name)
         
         # 1. Create the FunctionNode model
         func_props = properties.FunctionProperties(position=position, **kwargs)
+        func_key = db.nodes.new_key()
         func_node_model = node.FunctionNode(
+            _key=func_key,
             name=name,
             qname=qname,
             node_type="function",
             properties=func_props
         )
-        created_func_node = db.nodes.create(func_node_model)
 
-        # 2. Create the ContainsEdge
+        # 2. Create the ContainsEdge, stored with the node in one request
         contains_edge = edges.ContainsEdge(
             _from=self.id,
-            _to=created_func_node.id,
+            _to=db.nodes.document_id(func_key),
             position=position
         )
-        db.contains_edges.create(contains_edge)
+        created_func_node = db.nodes.create_linked(
+            func_node_model, db.contains_edges, contains_edge
+        )
 
         # 3. Return the hydrated Function domain object
         return Function(created_func_node)
@@ -59,46 +70,51 @@ class File(DomainObject[node.FileNode]):
     ) -> Class:
         """Adds a new class to this file."""
         # Use the file's qname as base and append class name
-        file_qname = self.model.qname
-        qname = f"{file_qname}.{name}"
+        qname = sys.intern(self._qname_prefix + name)
 
         # 1. Create the ClassNode model
         class_props = properties.ClassProperties(position=position, **kwargs)
+        class_key = db.nodes.new_key()
         class_node_model = node.ClassNode(
+            _key=class_key,
             name=name,
             qname=qname,
             node_type="class",
             properties=class_props
         )
-        created_class_node = db.nodes.create(class_node_model)
 
-        # 2. Create the ContainsEdge
+        # 2. Create the ContainsEdge, stored with the node in one request
         contains_edge = edges.ContainsEdge(
             _from=self.id,
-            _to=created_class_node.id,
+            _to=db.nodes.document_id(class_key),
             position=position
         )
-        db.contains_edges.create(contains_edge)
+        created_class_node = db.nodes.create_linked(
+            class_node_model, db.contains_edges, contains_edge
+        )
 
         # 3. Return the hydrated Class domain object
         return Class(created_class_node)
 
-    def get_functions(self) -> List[Function]:
-        """Retrieves all functions contained within this file."""
-        function_nodes = db.nodes.find_related(
+    def get_children(self) -> Tuple[List[Function], List[Class]]:
+        """
+        Retrieves the functions and classes contained within this file with
+        a single grouped query.
+        """
+        grouped = db.nodes.find_related_grouped(
             start_node_id=self.id,
             edge_collection=db.contains_edges,
-            direction="outbound",
-            filter_by_type="function"
+            node_types=["function", "class"]
+        )
+        return (
+            [Function(node_model) for node_model in grouped["function"]],
+            [Class(node_model) for node_model in grouped["class"]],
         )
-        return [Function(node_model) for node_model in function_nodes]
+
+    def get_functions(self) -> List[Function]:
+        """Retrieves all functions contained within this file."""
+        return self.get_children()[0]
 
     def get_classes(self) -> List[Class]:
         """Retrieves all classes contained within this file."""
-        class_nodes = db.nodes.find_related(
-            start_node_id=self.id,
-            edge_collection=db.contains_edges,
-            direction="outbound",
-            filter_by_type="class"
-        )
-        return [Class(node_model) for node_model in class_nodes]
\ No newline at end of file
+        return self.get_children()[1]
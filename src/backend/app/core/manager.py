@@ -1,17 +1,69 @@
 """
 The CodeGraphManager: the main entry point for the Domain API.
 """
-from typing import List
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 from .project import Project
 from ..models import node, properties
 from ..db import collections as db
 
+# Seconds a loaded project is served from memory before being re-read.
+PROJECT_CACHE_TTL = 60.0
+# Maximum number of projects kept in the cache; the least recently used
+# entry is evicted beyond this.
+PROJECT_CACHE_SIZE = 256
+
 
 class CodeGraphManager:
     """
     Provides high-level methods to create and load projects, serving as the
     entry point for all domain-centric graph operations.
     """
+    def __init__(
+        self,
+        project_cache_ttl: float = PROJECT_CACHE_TTL,
+        project_cache_size: int = PROJECT_CACHE_SIZE
+    ):
+        self.project_cache_ttl = project_cache_ttl
+        self.project_cache_size = project_cache_size
+        # project key -> (time loaded, hydrated Project), in LRU order
+        self._project_cache: OrderedDict[str, Tuple[float, Project]] = (
+            OrderedDict()
+        )
+        # The manager is shared across threadpool requests; every read and
+        # write of the cache's order goes through this lock
+        self._project_cache_lock = threading.Lock()
+
+    def _cache_project(self, project: Project) -> None:
+        """Stores a project in the bounded LRU cache."""
+        with self._project_cache_lock:
+            self._project_cache[project.key] = (time.monotonic(), project)
+            self._project_cache.move_to_end(project.key)
+            if len(self._project_cache) > self.project_cache_size:
+                self._project_cache.popitem(last=False)
+
+    def _get_cached_project(self, project_key: str) -> Optional[Project]:
+        """Returns the cached project for a key if it has not expired."""
+        with self._project_cache_lock:
+            cached = self._project_cache.get(project_key)
+            if cached is None:
+                return None
+            if time.monotonic() - cached[0] >= self.project_cache_ttl:
+                del self._project_cache[project_key]
+                return None
+            self._project_cache.move_to_end(project_key)
+            return cached[1]
+
+    def invalidate_project(self, project_key: str) -> None:
+        """
+        Drops a project from the cache so the next load re-reads it, e.g.
+        after a scan has rewritten its graph.
+        """
+        with self._project_cache_lock:
+            self._project_cache.pop(project_key, None)
+
     def create_project(self, name: str, path: str) -> Project:
         """
         Creates a new project node, saves it to the database, and returns a
@@ -29,7 +81,9 @@ class CodeGraphManager:
         created_node = db.nodes.create(project_node_model)
 
         # 3. Return the hydrated domain object
-        return Project(created_node)
+        project = Project(created_node)
+        self._cache_project(project)
+        return project
 
     def create_project_with_scan(self, name: str, path: str) -> Project:
         """
@@ -38,8 +92,8 @@ class CodeGraphManager:
         """
         from .parser.project_scanner import ProjectScanner
         
-        # Create scanner and run full scan
-        scanner = ProjectScanner(path)
+        # Create scanner and run full scan, sharing this manager
+        scanner = ProjectScanner(path, code_graph_manager=self)
         scanner.scan()
         
         # Return the created project
@@ -49,7 +103,14 @@ class CodeGraphManager:
         """
         Loads an existing project from the database by its key and returns a
         hydrated Project domain object.
+
+        Projects are cached per manager for `project_cache_ttl` seconds so
+        repeated lookups of the same key do not hit the database each time.
         """
+        cached = self._get_cached_project(project_key)
+        if cached is not None:
+            return cached
+
         # 1. Load the project node from the 'nodes' collection
         project_node = db.nodes.get(project_key)
         if not project_node:
@@ -61,7 +122,9 @@ class CodeGraphManager:
             )
 
         # 2. Return the hydrated domain object
-        return Project(project_node)
+        project = Project(project_node)
+        self._cache_project(project)
+        return project
 
     def get_all_projects(self) -> List[Project]:
         """
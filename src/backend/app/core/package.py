@@ -7,6 +7,8 @@ class Package(DomainObject[node.PackageNode]):
     """
     A domain object representing an external package dependency.
     """
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return self.model.name
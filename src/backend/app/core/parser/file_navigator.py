@@ -1,44 +1,138 @@
+import os
+import re
+import stat
+import threading
+import tomllib
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, ClassVar, Dict, Iterator, List, Optional, Tuple
 import pathspec
-try:
-    import tomllib
-except ModuleNotFoundError:
-    import toml as tomllib  # type: ignore
+
+
+_NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+
+# Most ignore specs kept across navigators; least recently used go first
+SPEC_CACHE_SIZE = 64
 
 
 class FileNavigator:
+    # Ignore file path -> (mtime_ns, compiled spec), shared by every
+    # navigator so rescans of an unchanged project skip the TOML parse.
+    # Only the latest mtime per file is kept, for at most SPEC_CACHE_SIZE
+    # files, in LRU order
+    _spec_cache: ClassVar[
+        OrderedDict[str, Tuple[int, Optional[pathspec.PathSpec]]]
+    ] = OrderedDict()
+    _spec_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, root_path: str, ignore_file_name: str = ".gitignore"):
         self.root_path = Path(root_path)
        
         self.ignore_file_name = ignore_file_name
         self.spec = self._load_ignore_spec()
+        self._is_ignored = self._build_matcher()
+        # Ignore decisions per relative directory, reused by later walks
+        self._dir_ignored: Dict[str, bool] = {}
 
     def _load_ignore_spec(self) -> Optional[pathspec.PathSpec]:
-        ignore_file = self.root_path / self.ignore_file_name
-        if ignore_file.is_file():
-                with ignore_file.open("rb") as f:
-                    toml_data = tomllib.load(f)
-                    patterns = toml_data.get("ignore", {}).get("patterns", [])
-                    if patterns:
-                        return pathspec.PathSpec.from_lines(
-                            "gitwildmatch", patterns
-                    )
-        return None
+        ignore_file = str(self.root_path / self.ignore_file_name)
+        try:
+            st = os.stat(ignore_file)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+
+        with self._spec_cache_lock:
+            cached = self._spec_cache.get(ignore_file)
+            if cached is not None and cached[0] == st.st_mtime_ns:
+                self._spec_cache.move_to_end(ignore_file)
+                return cached[1]
+
+        spec = None
+        with open(ignore_file, "rb") as f:
+            toml_data = tomllib.load(f)
+            patterns = toml_data.get("ignore", {}).get("patterns", [])
+            if patterns:
+                spec = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+        with self._spec_cache_lock:
+            self._spec_cache[ignore_file] = (st.st_mtime_ns, spec)
+            self._spec_cache.move_to_end(ignore_file)
+            while len(self._spec_cache) > SPEC_CACHE_SIZE:
+                self._spec_cache.popitem(last=False)
+        return spec
+
+    def _build_matcher(self) -> Optional[Callable[[str], bool]]:
+        """
+        Returns a callable telling whether a relative path is ignored.
+
+        Without negated patterns any match means ignored, so the spec's
+        regexes are fused into one alternation matched in a single pass.
+        With negations the last matching pattern wins, which an alternation
+        cannot express, so the spec itself is used.
+        """
+        if self.spec is None:
+            return None
+        patterns = [p for p in self.spec.patterns if p.include is not None]
+        if not patterns:
+            return None
+        if any(not p.include for p in patterns):
+            return self.spec.match_file
+        # Group names repeat across patterns, which a union would reject
+        union = "|".join(
+            f"(?:{_NAMED_GROUP.sub('(?:', p.regex.pattern)})" for p in patterns
+        )
+        match = re.compile(union).match
+        return lambda path: match(path) is not None
+
+    def _is_dir_ignored(self, rel_dir_path: str) -> bool:
+        ignored = self._dir_ignored.get(rel_dir_path)
+        if ignored is None:
+            ignored = self._dir_ignored[rel_dir_path] = self._is_ignored(
+                rel_dir_path
+            )
+        return ignored
 
     def find_files(self, extensions: Optional[List[str]] = None) -> List[str]:
-        found_files = []
-        for file_path in self.root_path.rglob("*"):
-            if file_path.is_file():
-                if (
-                    self.spec and self.spec.match_file(
-                        str(file_path.relative_to(self.root_path))
-                    )
-                ):
-                    continue
-                if extensions:
-                    if file_path.suffix in extensions:
-                        found_files.append(str(file_path))
-                else:
-                    found_files.append(str(file_path))
-        return found_files
+        return list(self.iter_files(extensions))
+
+    def iter_files(self, extensions: Optional[List[str]] = None) -> Iterator[str]:
+        """
+        Yields matching file paths as the walk discovers them, so callers
+        can start work on early files before the whole tree is listed.
+        """
+        # str.endswith accepts a tuple and checks every suffix in C
+        wanted = tuple(extensions) if extensions else None
+        # Iterative walk over raw strings: no Path object per entry and no
+        # relative_to() call; each path relative to the root is built by
+        # appending to its parent's, with "/" as pathspec expects
+        stack = [(str(self.root_path), "")]
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        rel_path = rel_dir + entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            rel_dir_path = rel_path + "/"
+                            # Prune ignored directories instead of matching
+                            # every file beneath them; the trailing slash
+                            # lets directory-only patterns like "build/" hit
+                            if (
+                                self._is_ignored
+                                and self._is_dir_ignored(rel_dir_path)
+                            ):
+                                continue
+                            stack.append((entry.path, rel_dir_path))
+                            continue
+                        # DirEntry caches its type from readdir, so only
+                        # symlinks cost a stat here
+                        if not entry.is_file():
+                            continue
+                        if wanted is not None and not entry.name.endswith(wanted):
+                            continue
+                        if self._is_ignored and self._is_ignored(rel_path):
+                            continue
+                        yield entry.path
+            except OSError:
+                continue
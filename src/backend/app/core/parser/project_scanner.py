@@ -1,178 +1,243 @@
 # src/backend/app/core/parser/project_scanner.py
+import logging
 import os
-from typing import Dict, Any
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
 from app.db import collections
 from app.models.edges import BelongsToEdge, ContainsEdge, UsesImportEdge
+from app.models.base import ArangoBase
 from app.models.node import PackageNode
 from app.models.properties import PackageProperties
 
 from .file_navigator import FileNavigator
 from .python.ast_cache import ASTCache
 from .python.symbol_table import SymbolTable
-from .python.file_parser import PythonFileParser
-from ..manager import CodeGraphManager
+from .python.file_parser import PythonFileParser, parse_declarations
+from ..folder import Folder
+from ..qname import path_to_qname
+from ..manager import CodeGraphManager, code_graph_manager as shared_manager
 from ..tree_builder import build_tree_from_paths
 
+logger = logging.getLogger(__name__)
+
 
 class ProjectScanner:
     """
     The main entry point and orchestrator for parsing a whole project using
     the advanced two-pass analysis system.
     """
-    def __init__(self, project_path: str):
+    def __init__(
+        self,
+        project_path: str,
+        code_graph_manager: Optional[CodeGraphManager] = None,
+        ast_cache_dir: Optional[str] = None,
+        parse_workers: Optional[int] = None,
+        ast_cache_size: Optional[int] = None
+    ):
         self.project_path = project_path
+        # Normalized the way the navigator joins paths, so every discovered
+        # path starts with _prefix and can be made relative by slicing
+        self._root = str(Path(project_path))
+        self._prefix = self._root.rstrip(os.sep) + os.sep
+        self._prefix_len = len(self._prefix)
+        # Worker processes for the declaration pass; None or 1 parses inline
+        self.parse_workers = parse_workers
         self.file_navigator = FileNavigator(project_path)
-        self.code_graph_manager = CodeGraphManager()
+        # Reuse the caller's manager when given so its state is shared;
+        # otherwise the app-wide one, whose project cache a scan must clear
+        self.code_graph_manager = code_graph_manager or shared_manager
         self.file_parser = PythonFileParser(
-            ast_cache=ASTCache(),
+            # Bounding the in-memory ASTs trades re-parsing in the detail
+            # pass for memory on large projects
+            ast_cache=ASTCache(cache_dir=ast_cache_dir, maxsize=ast_cache_size),
             symbol_table=SymbolTable(),
-            project_root=project_path
+            project_root=self._root
         )
         self.symbol_table = self.file_parser.symbol_table
         self.created_packages: set = set()
         # Track package name -> ID mapping
         self.package_ids: Dict[str, str] = {}
+        # File path -> file node ID, filled while the hierarchy is built
+        self._path_to_file_id: Dict[str, str] = {}
 
     def create_nodes_and_edges_from_tree(
         self, 
         tree: Dict[str, Any], 
         parent_node, 
-        parent_path: str
+        parent_path: str,
+        parent_qname: str = ""
     ) -> None:
         """
-        Recursively creates folder and file nodes from the tree structure
-        and links them with ContainsEdge and BelongsToEdge.
+        Creates folder and file nodes from the tree structure and links them
+        with ContainsEdge and BelongsToEdge.
+
+        Node keys are allocated client-side, so the whole hierarchy is
+        built in memory first and then stored with one bulk insert per
+        collection instead of several requests per node.
+
+        Qnames are extended from ``parent_qname`` one name at a time, which
+        is empty for the project root.
         """
+        tree_nodes: List[Any] = []
+        contains_edges: List[ContainsEdge] = []
+        belongs_to_edges: List[BelongsToEdge] = []
+        self._collect_tree_nodes(
+            tree, parent_node, parent_path, parent_qname,
+            tree_nodes, contains_edges, belongs_to_edges
+        )
+
+        # Every ID is already known, so nothing needs to be read back
+        collections.nodes.insert_many(tree_nodes)
+        collections.contains_edges.insert_many(contains_edges)
+        collections.belongs_to_edges.insert_many(belongs_to_edges)
+
+    def _collect_tree_nodes(
+        self,
+        tree: Dict[str, Any],
+        parent_node,
+        parent_path: str,
+        parent_qname: str,
+        tree_nodes: List[Any],
+        contains_edges: List[ContainsEdge],
+        belongs_to_edges: List[BelongsToEdge]
+    ) -> None:
+        """
+        Recursively builds the node and edge models for ``tree`` under
+        ``parent_node`` and registers each node in the symbol table.
+        """
+        # Each child's qname is its parent's plus one dotted component
+        qname_prefix = f"{parent_qname}." if parent_qname else ""
         for name, subtree in tree.items():
             current_path = os.path.join(parent_path, name)
             
             if subtree is None:
                 # It's a file - create FileNode
-                file_qname = current_path.replace(
-                    self.project_path, ""
-                ).lstrip("/").replace(".py", "").replace("/", ".")
+                stem = name[:-3] if name.endswith(".py") else name
+                file_qname = qname_prefix + stem
                 
                 # Make path relative to project
-                relative_path = (current_path.replace(self.project_path, "")
-                                .lstrip("/"))
+                relative_path = current_path[self._prefix_len:]
                 
-                file_node = parent_node.add_file(
+                file_model, contains_edge = parent_node.prepare_file(
                     file_name=name,
                     file_path=relative_path
                 )
+                tree_nodes.append(file_model)
+                contains_edges.append(contains_edge)
                 
                 # Link file to project with BelongsToEdge
-                belongs_to_edge = BelongsToEdge(
-                    _from=file_node.id,
+                belongs_to_edges.append(BelongsToEdge(
+                    _from=file_model.id,
                     _to=self.project.id
-                )
-                collections.belongs_to_edges.create(belongs_to_edge)
+                ))
                 
                 # Add to symbol table
-                self.symbol_table.add_symbol(file_qname, file_node.id)
+                self.symbol_table.add_symbol(file_qname, file_model.id)
+                self._path_to_file_id[current_path] = file_model.id
                 
             else:
                 # It's a folder - create FolderNode
-                folder_qname = current_path.replace(
-                    self.project_path, ""
-                ).lstrip("/").replace("/", ".")
+                folder_qname = qname_prefix + name
                 
                 # Make path relative to project
-                relative_path = (current_path.replace(self.project_path, "")
-                                .lstrip("/"))
+                relative_path = current_path[self._prefix_len:]
                 
-                folder_node = parent_node.add_folder(
+                folder_model, contains_edge = parent_node.prepare_folder(
                     folder_name=name,
                     folder_path=relative_path
                 )
+                tree_nodes.append(folder_model)
+                contains_edges.append(contains_edge)
                 
                 # Link folder to project with BelongsToEdge
-                belongs_to_edge = BelongsToEdge(
-                    _from=folder_node.id,
+                belongs_to_edges.append(BelongsToEdge(
+                    _from=folder_model.id,
                     _to=self.project.id
-                )
-                collections.belongs_to_edges.create(belongs_to_edge)
+                ))
                 
                 # Add to symbol table
-                self.symbol_table.add_symbol(folder_qname, folder_node.id)
+                self.symbol_table.add_symbol(folder_qname, folder_model.id)
                 
-                # Recurse for subdirectories
-                self.create_nodes_and_edges_from_tree(
-                    subtree, folder_node, current_path
+                # Recurse for subdirectories; the folder's id is already
+                # known, so it can parent its children before being stored
+                self._collect_tree_nodes(
+                    subtree, Folder(folder_model), current_path, folder_qname,
+                    tree_nodes, contains_edges, belongs_to_edges
                 )
 
     def get_file_qname_from_path(self, file_path: str) -> str:
         """
         Generate the file qname from file path using the same pattern.
         """
-        return file_path.replace(
-            self.project_path, ""
-        ).lstrip("/").replace(".py", "").replace("/", ".")
+        if file_path.startswith(self._prefix):
+            return path_to_qname(file_path[self._prefix_len:])
+        return path_to_qname(file_path, self._root)
 
-    def _create_package_node(self, package_qname: str) -> str:
+    def _create_package_nodes(self, imported_paths: Dict[str, List[str]]) -> None:
         """
-        Creates a package node for an external package if it doesn't exist.
-        Only creates one node per base package and tracks imported paths.
+        Ensures a package node exists for each external base package.
+
+        Missing packages are inserted with one bulk request, then linked to
+        the project with another; packages stored by an earlier call only
+        get any new imported paths added.
         
         Args:
-            package_qname: The fully qualified name of the package
-            
-        Returns:
-            The database ID of the created package node
+            imported_paths: Base package name (e.g. "pydantic") mapped to
+                the qualified names imported from it
         """
-        # Extract base package name (e.g., "pydantic" from 
-        # "pydantic.BaseModel")
-        base_package = package_qname.split('.')[0]
-        
-        # Check if base package already exists
-        if base_package in self.created_packages:
-            print(f"Package {base_package} already created")
+        new_packages = []
+        for base_package, paths in imported_paths.items():
             existing_package_id = self.package_ids.get(base_package)
-            if existing_package_id:
-                # Update the existing package with new imported path
-                existing_node = collections.nodes.get(existing_package_id)
-                if (existing_node and package_qname not in 
-                        existing_node.properties.imported_paths):
-                    existing_node.properties.imported_paths.append(
-                        package_qname
-                    )
-                    collections.nodes.update(existing_node)
-                return existing_package_id
-        
-        # Create the package node
-        package_node = PackageNode(
-            name=base_package,  # Use base package as name
-            qname=base_package,  # Use base package as qname
-            properties=PackageProperties(imported_paths=[package_qname])
-        )
-        
-        # Save to database
-        created_package = collections.nodes.create(package_node)
-        
-        # Track the package ID for future lookups
-        self.package_ids[base_package] = created_package.id
-        
-        # Link package to project with BelongsToEdge
-        belongs_to_edge = BelongsToEdge(
-            _from=created_package.id,
-            _to=self.project.id
-        )
-        collections.belongs_to_edges.create(belongs_to_edge)
-        
-        # Mark base package as created
-        self.created_packages.add(base_package)
-        
-        return created_package.id
+            if existing_package_id is None:
+                new_packages.append(PackageNode(
+                    name=base_package,  # Use base package as name
+                    qname=base_package,  # Use base package as qname
+                    properties=PackageProperties(imported_paths=paths)
+                ))
+                continue
+
+            existing_node = collections.nodes.get(existing_package_id)
+            if existing_node is None:
+                continue
+            known = existing_node.properties.imported_paths
+            missing = [path for path in paths if path not in known]
+            if missing:
+                known.extend(missing)
+                collections.nodes.update(existing_node)
+
+        created_packages = collections.nodes.create_many(new_packages)
+
+        belongs_to_edges = []
+        for created_package in created_packages:
+            # Track the package ID for future lookups
+            self.package_ids[created_package.name] = created_package.id
+            self.created_packages.add(created_package.name)
+            # Link package to project with BelongsToEdge
+            belongs_to_edges.append(BelongsToEdge(
+                _from=created_package.id,
+                _to=self.project.id
+            ))
+        collections.belongs_to_edges.insert_many(belongs_to_edges)
 
     def _process_dependency_edges(self, edges: list) -> None:
         """
         Processes the dependency edges from the detail pass, creating 
         package nodes as needed and linking them properly.
+
+        All package nodes and import edges are written in bulk, so the
+        cost does not grow with how often a package is imported.
         
         Args:
             edges: List of UsesImportEdge models with target_qname metadata
         """
+        import_edges: List[UsesImportEdge] = []
+        external_edges: List[Tuple[UsesImportEdge, str]] = []
+        # Base package -> imported qnames, deduplicated in first-seen order
+        imported_paths: Dict[str, Dict[str, None]] = {}
+
         for edge in edges:
             if not isinstance(edge, UsesImportEdge):
                 continue
@@ -182,21 +247,59 @@ class ProjectScanner:
                 continue
             
             # Check if it's a local module or external package
-            is_local = self.symbol_table.is_local_module(target_qname)
-            
-            if is_local:
+            if self.symbol_table.is_local_module(target_qname):
                 # It's a local module - find the existing node ID
                 target_id = self.symbol_table.get_symbol_id(target_qname)
                 if target_id:
                     edge.to_id = target_id
-                    collections.uses_import_edges.create(edge)
+                    import_edges.append(edge)
                 else:
-                    print(f"Warning: Local module {target_qname} not found")
+                    logger.warning("Local module %s not found", target_qname)
             else:
-                # It's an external package - create package node if needed
-                package_id = self._create_package_node(target_qname)
-                edge.to_id = package_id
-                collections.uses_import_edges.create(edge)
+                # Extract base package name (e.g., "pydantic" from
+                # "pydantic.BaseModel"); its node ID is filled in below
+                base_package = target_qname.split('.')[0]
+                imported_paths.setdefault(base_package, {})[target_qname] = None
+                external_edges.append((edge, base_package))
+                import_edges.append(edge)
+
+        if imported_paths:
+            self._create_package_nodes({
+                base_package: list(paths)
+                for base_package, paths in imported_paths.items()
+            })
+        for edge, base_package in external_edges:
+            edge.to_id = self.package_ids[base_package]
+
+        collections.uses_import_edges.insert_many(import_edges)
+
+    def _discover_files(
+        self, pool: Optional[ProcessPoolExecutor]
+    ) -> Tuple[List[str], Iterator[Tuple[str, Optional[List[ArangoBase]]]]]:
+        """
+        Walks the project for Python files and returns them along with an
+        iterator of ``(file_path, declared_nodes)`` in the same order.
+
+        With a pool, each file is submitted for parsing the moment the walk
+        finds it, so directory traversal overlaps with parsing in the
+        workers; database writes stay with the caller in this process.
+        """
+        files = self.file_navigator.iter_files(extensions=[".py"])
+        if pool is None:
+            py_files = list(files)
+            return py_files, self.file_parser.parse_many(py_files)
+
+        parse = partial(
+            parse_declarations,
+            self._root,
+            self.file_parser.ast_cache.cache_dir
+        )
+        py_files = []
+        futures = []
+        for file_path in files:
+            py_files.append(file_path)
+            futures.append(pool.submit(parse, file_path))
+        return py_files, (future.result() for future in futures)
 
     def scan(self) -> None:
         """
@@ -213,81 +316,90 @@ class ProjectScanner:
         # Add project to symbol table
         self.symbol_table.add_symbol(self.project.name, self.project.id)
 
+        # Worker processes for the declaration pass, if configured
+        pool = None
+        if self.parse_workers and self.parse_workers > 1:
+            pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+        try:
+            self._scan_files(pool)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+            # The project was cached before its graph was written
+            self.code_graph_manager.invalidate_project(self.project.key)
+
+    def _scan_files(self, pool: Optional[ProcessPoolExecutor]) -> None:
+        """Runs the three passes over the project's Python files."""
         # First Pass: Build folder/file hierarchy
-        py_files = self.file_navigator.find_files(extensions=[".py"])
+        py_files, declarations = self._discover_files(pool)
         
         # Build tree structure from file paths
-        tree = build_tree_from_paths(py_files, self.project_path)
+        tree = build_tree_from_paths(py_files, self._root)
         
         # Create folder and file nodes with proper edges
         self.create_nodes_and_edges_from_tree(
-            tree, self.project, self.project_path
+            tree, self.project, self._root
         )
 
         # Second Pass: Process declarations for each Python file
-        for file_path in py_files:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-            except Exception as e:
-                print(f"Error reading file {file_path}: {e}")
+        failed_files = set()
+        for file_path, declared_nodes in declarations:
+            if declared_nodes is None:
+                # Already logged by the parser; the detail pass skips it too
+                failed_files.add(file_path)
                 continue
 
-            # Get the file qname and find the corresponding file node
-            file_qname = self.get_file_qname_from_path(file_path)
-            file_node_id = self.symbol_table._qname_to_id.get(file_qname)
+            file_node_id = self._path_to_file_id.get(file_path)
             
             if not file_node_id:
-                print(f"Warning: Could not find file node for {file_path}")
+                logger.warning("Could not find file node for %s", file_path)
                 continue
 
-            declared_nodes = self.file_parser.run_declaration_pass(
-                file_path, content
-            )
+            # Declarations carry their project on the document instead of
+            # a BelongsToEdge each; project_id is indexed for lookups.
+            # Keys are allocated here, so the symbol table and edges are
+            # filled from the inputs and nothing is read back
+            contains_edges = []
             for node in declared_nodes:
-                created_node = collections.nodes.create(node)
-                self.symbol_table.add_symbol(
-                    created_node.qname, created_node.id
-                )
+                key = collections.nodes.new_key()
+                node.key = key
+                node.id = collections.nodes.document_id(key)
+                node.project_id = self.project.id
+                self.symbol_table.add_symbol(node.qname, node.id)
                 
                 # Link declared nodes to their file with ContainsEdge
-                contains_edge = ContainsEdge(
+                contains_edges.append(ContainsEdge(
                     _from=file_node_id,
-                    _to=created_node.id,
+                    _to=node.id,
                     position=node.properties.position
-                )
-                collections.contains_edges.create(contains_edge)
-                
-                # Link declared nodes to project with BelongsToEdge
-                # Not Sure the usage of this edge (might be removed)
-                belongs_to_edge = BelongsToEdge(
-                    _from=created_node.id,
-                    _to=self.project.id
-                )
-                collections.belongs_to_edges.create(belongs_to_edge)
+                ))
+
+            collections.nodes.insert_many(declared_nodes)
+            collections.contains_edges.insert_many(contains_edges)
 
         # Third Pass: Phase 2 - Process dependencies and imports
-        print("Processing dependencies and imports...")
+        logger.info("Processing dependencies and imports...")
+        dependency_edges = []
         for file_path in py_files:
-            # Get the file qname and find the corresponding file node
-            file_qname = self.get_file_qname_from_path(file_path)
-            file_node_id = self.symbol_table._qname_to_id.get(file_qname)
+            file_node_id = self._path_to_file_id.get(file_path)
             
-            if not file_node_id:
+            if not file_node_id or file_path in failed_files:
                 continue
                 
             # Run the detail pass to get dependency edges
-            dependency_edges = self.file_parser.run_detail_pass(
-                file_path, file_node_id
+            dependency_edges.extend(
+                self.file_parser.run_detail_pass(file_path, file_node_id)
             )
             
-            # Process the edges, creating package nodes as needed
-            self._process_dependency_edges(dependency_edges)
+        # Process the edges of every file together, creating package
+        # nodes as needed, so the writes are batched across the project
+        self._process_dependency_edges(dependency_edges)
 
-        print(
-            f"Project scan complete. "
-            f"Processed {len(py_files)} files, "
-            f"created {len(self.created_packages)} package nodes."
+        logger.info(
+            "Project scan complete. Processed %d files, "
+            "created %d package nodes.",
+            len(py_files),
+            len(self.created_packages)
         )
     
     def get_scan_summary(self) -> Dict[str, Any]:
@@ -305,8 +417,5 @@ class ProjectScanner:
             ),
             "total_symbols": len(self.symbol_table._qname_to_id),
             "created_packages": list(self.created_packages),
-            "cached_files": (
-                len(self.ast_cache._cache) 
-                if hasattr(self.ast_cache, '_cache') else 0
-            )
+            "cached_files": len(self.file_parser.get_cached_files())
         }
@@ -1,17 +1,123 @@
 # src/backend/app/core/parser/python/ast_cache.py
 import ast
-from typing import Dict
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
 
 class ASTCache:
     """
     A simple in-memory cache for storing the Abstract Syntax Trees (ASTs)
     of files to avoid re-reading and re-parsing them between analysis passes.
+
+    With a ``maxsize``, only that many trees are kept in memory and the
+    least recently used one is dropped first; a dropped file is re-parsed
+    (or loaded from disk) when it is next needed.
+
+    When a ``cache_dir`` is given, parsed trees are also pickled to disk keyed
+    by the SHA256 of the source and the running Python version, so unchanged
+    files are not re-parsed on the next scan.
     """
-    def __init__(self):
-        self._file_asts: Dict[str, ast.Module] = {}
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        maxsize: Optional[int] = None
+    ):
+        self._file_asts: OrderedDict[str, ast.Module] = OrderedDict()
+        self.maxsize = maxsize
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.hits = 0
+        self.misses = 0
 
     def get(self, file_path: str) -> ast.Module | None:
-        return self._file_asts.get(file_path)
+        tree = self._file_asts.get(file_path)
+        if tree is not None and self.maxsize is not None:
+            self._file_asts.move_to_end(file_path)
+        return tree
 
     def set(self, file_path: str, ast_tree: ast.Module) -> None:
         self._file_asts[file_path] = ast_tree
+        if self.maxsize is not None:
+            self._file_asts.move_to_end(file_path)
+            while len(self._file_asts) > self.maxsize:
+                self._file_asts.popitem(last=False)
+
+    def clear(self, file_path: Optional[str] = None) -> None:
+        """Drops the in-memory tree for ``file_path``, or all of them."""
+        if file_path is None:
+            self._file_asts.clear()
+        else:
+            self._file_asts.pop(file_path, None)
+
+    def cached_files(self) -> List[str]:
+        return list(self._file_asts)
+
+    def parse(self, file_path: str, content: Union[str, bytes]) -> ast.Module:
+        """
+        Parses ``content`` and caches the resulting tree for ``file_path``.
+
+        Raises:
+            SyntaxError: If the source cannot be parsed.
+        """
+        if self.cache_dir is None:
+            tree = ast.parse(content, filename=file_path)
+        else:
+            tree = self._parse_persistent(file_path, content)
+        self.set(file_path, tree)
+        return tree
+
+    def _parse_persistent(
+        self, file_path: str, content: Union[str, bytes]
+    ) -> ast.Module:
+        source = content.encode("utf-8") if isinstance(content, str) else content
+        digest = hashlib.sha256(source)
+        digest.update(sys.version.encode("utf-8"))
+        key = digest.hexdigest()
+        # Shard by the first byte so no single directory grows unbounded
+        shard = self.cache_dir / key[:2]
+        cached_path = shard / f"{key}.pkl"
+
+        try:
+            with open(cached_path, "rb") as f:
+                tree = pickle.load(f)
+            self.hits += 1
+            return tree
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug("Discarding unreadable AST cache entry %s: %s", cached_path, e)
+
+        self.misses += 1
+        tree = ast.parse(content, filename=file_path)
+        # Persisting is best-effort: a tree too deep to pickle (RecursionError)
+        # or an unwritable cache dir must not fail a parse that succeeded
+        tmp_path = None
+        try:
+            shard.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see a partial pickle
+            fd, tmp_path = tempfile.mkstemp(dir=shard, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cached_path)
+        except Exception as e:
+            logger.debug("Could not persist AST for %s: %s", file_path, e)
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+        return tree
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of persistent-cache lookups served from disk."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
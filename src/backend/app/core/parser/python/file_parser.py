@@ -1,6 +1,12 @@
 # src/backend/app/core/parser/python/file_parser.py
 import ast
-from typing import List
+import logging
+import mmap
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
 from .ast_cache import ASTCache
 from .symbol_table import SymbolTable
 from .visitors.declaration_visitor import DeclarationVisitor
@@ -15,6 +21,107 @@ from ....models.node import (
 )
 from ....models.properties import FunctionProperties, ClassProperties
 from ....models.base import ArangoBase
+from ...qname import path_to_qname
+
+logger = logging.getLogger(__name__)
+
+# Files at least this large are memory-mapped instead of read into a copy
+MMAP_THRESHOLD = 64 * 1024
+
+# Only free-threaded builds (3.13t+) can run ast.parse on several threads
+# at once; with the GIL, threads would just take turns
+FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+@contextmanager
+def read_source(file_path: str) -> Iterator[bytes | mmap.mmap]:
+    """
+    Yields the raw source of a file for ``ast.parse``.
+
+    Large files are memory-mapped so the page cache backs the buffer
+    directly; the mapping is only valid inside the ``with`` block. Small
+    files are read straight off the descriptor in one ``os.read`` call,
+    skipping the buffered file object ``open`` would build around it.
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size < MMAP_THRESHOLD:
+            yield os.read(fd, size)
+            return
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+    finally:
+        os.close(fd)
+
+
+def parse_declarations(
+    project_root: str,
+    cache_dir: Optional[str],
+    file_path: str
+) -> Tuple[str, Optional[List[ArangoBase]]]:
+    """
+    Runs the declaration pass for one file on a throwaway parser.
+
+    Module-level so it can be shipped to worker processes; returns the file
+    path with its declared nodes, or ``None`` if the file could not be read
+    or processed. Errors never propagate, so one bad file cannot fail the
+    whole pool run when its future's result is taken.
+    """
+    parser = PythonFileParser(
+        ast_cache=ASTCache(cache_dir=cache_dir),
+        symbol_table=SymbolTable(),
+        project_root=project_root
+    )
+    return file_path, parser.declare_file(file_path)
+
+
+def _read_and_parse(file_path: str) -> ast.Module | Exception:
+    """Reads and parses one file, returning the error instead of raising."""
+    try:
+        with read_source(file_path) as content:
+            return ast.parse(content, filename=file_path)
+    except Exception as e:
+        return e
+
+
+def _log_file_error(file_path: str, error: Exception) -> None:
+    """Logs why a file was skipped by the declaration pass."""
+    if isinstance(error, OSError):
+        logger.error("Error reading file %s: %s", file_path, error)
+    else:
+        logger.error("Error parsing declarations in %s: %s", file_path, error)
+
+
+def _group_methods(
+    classes: List[ast.ClassDef], functions: List[ast.FunctionDef]
+) -> Tuple[Dict[ast.ClassDef, List[ast.FunctionDef]], List[ast.FunctionDef]]:
+    """
+    Assigns each function to its innermost enclosing class in one sweep.
+
+    Classes and functions are merged by start line while a stack holds the
+    classes still open at that line, so the top of the stack encloses the
+    next function. Returns the methods per class and the functions outside
+    any class, both in source order.
+    """
+    events = sorted(
+        [(node.lineno, 0, i, node) for i, node in enumerate(classes)]
+        + [(node.lineno, 1, i, node) for i, node in enumerate(functions)]
+    )
+    methods: Dict[ast.ClassDef, List[ast.FunctionDef]] = {}
+    module_functions: List[ast.FunctionDef] = []
+    open_classes: List[ast.ClassDef] = []
+    for lineno, kind, _, node in events:
+        while open_classes and open_classes[-1].end_lineno < lineno:
+            open_classes.pop()
+        if kind == 0:
+            open_classes.append(node)
+        elif open_classes:
+            methods.setdefault(open_classes[-1], []).append(node)
+        else:
+            module_functions.append(node)
+    return methods, module_functions
+
 
 class PythonFileParser:
     """
@@ -25,32 +132,94 @@ class PythonFileParser:
         self.symbol_table = symbol_table
         self.project_root = project_root
 
-    def _get_qname(self, file_path: str, parts: List[str]) -> str:
-        """Constructs a fully qualified name."""
-        relative_path = file_path.replace(self.project_root, "").lstrip("/")
-        module_path = relative_path.replace(".py", "").replace("/", ".")
-        return f"{module_path}.{'.'.join(parts)}"
-
-    def run_declaration_pass(self, file_path: str, file_content: str) -> List[ArangoBase]:
+    def run_declaration_pass(self, file_path: str, file_content: str | bytes) -> List[ArangoBase]:
         """
         Runs the first pass of the analysis to find all high-level declarations.
+
+        Raw ``bytes`` are preferred: ``ast.parse`` honours the PEP 263
+        encoding declaration itself, so no separate decode is needed.
         """
         try:
-            tree = ast.parse(file_content, filename=file_path)
-            self.ast_cache.set(file_path, tree)
+            tree = self.ast_cache.parse(file_path, file_content)
         except SyntaxError as e:
             # In Phase 5, this will create an AnalysisIssue. For now, we just log.
-            print(f"Syntax error in {file_path}: {e}")
+            logger.warning("Syntax error in %s: %s", file_path, e)
             return []
+        return self._collect_declarations(file_path, tree)
+
+    def declare_file(self, file_path: str) -> Optional[List[ArangoBase]]:
+        """
+        Reads ``file_path`` and runs the declaration pass on it.
 
+        Any failure, e.g. an unreadable file or a ``RecursionError`` from
+        ``ast.parse`` on a deeply nested expression, is logged and gives
+        ``None`` so the caller skips the file. A syntax error still gives
+        an empty list, as in ``run_declaration_pass``.
+        """
+        try:
+            with read_source(file_path) as content:
+                return self.run_declaration_pass(file_path, content)
+        except Exception as e:
+            _log_file_error(file_path, e)
+            return None
+
+    def parse_many(
+        self, file_paths: List[str]
+    ) -> Iterator[Tuple[str, Optional[List[ArangoBase]]]]:
+        """
+        Runs the declaration pass over several files, yielding each path
+        with its declared nodes in input order. Failures follow
+        ``declare_file``: the file is logged and yields ``None``.
+
+        On free-threaded builds without a persistent AST cache, reading and
+        ``ast.parse`` run on a thread pool; the visitor, node building and
+        cache updates stay on the calling thread.
+        """
+        if not FREE_THREADED or self.ast_cache.cache_dir or len(file_paths) < 2:
+            for file_path in file_paths:
+                yield file_path, self.declare_file(file_path)
+            return
+
+        max_workers = min(32, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = pool.map(_read_and_parse, file_paths)
+            for file_path, tree in zip(file_paths, results):
+                if isinstance(tree, SyntaxError):
+                    logger.warning("Syntax error in %s: %s", file_path, tree)
+                    yield file_path, []
+                    continue
+                if isinstance(tree, Exception):
+                    _log_file_error(file_path, tree)
+                    yield file_path, None
+                    continue
+                self.ast_cache.set(file_path, tree)
+                try:
+                    declared_nodes = self._collect_declarations(file_path, tree)
+                except Exception as e:
+                    _log_file_error(file_path, e)
+                    declared_nodes = None
+                yield file_path, declared_nodes
+
+    def _collect_declarations(
+        self, file_path: str, tree: ast.Module
+    ) -> List[ArangoBase]:
+        """Builds class and function nodes for the declarations in ``tree``."""
         visitor = DeclarationVisitor()
         visitor.visit(tree)
 
+        methods, module_functions = _group_methods(
+            visitor.declared_classes, visitor.declared_functions
+        )
+
+        # Every qname in the file shares the module path, so it is derived
+        # once; interned since it is repeated in every symbol-table key
+        module_prefix = sys.intern(
+            path_to_qname(file_path, self.project_root) + "."
+        )
+
         nodes: List[ArangoBase] = []
-        processed_funcs = set()
-        
         for class_node in visitor.declared_classes:
-            class_qname = self._get_qname(file_path, [class_node.name])
+            class_qname = module_prefix + class_node.name
             nodes.append(ClassNode(
                 name=class_node.name,
                 qname=class_qname,
@@ -64,33 +233,11 @@ class PythonFileParser:
                 )
             ))
 
-            for func_node in visitor.declared_functions:
-                # Check if the function is a method of the current class
-                if (func_node.lineno >= class_node.lineno and
-                        func_node.end_lineno <= class_node.end_lineno):
-                    
-                    method_qname = self._get_qname(file_path, [class_node.name, func_node.name])
-                    nodes.append(FunctionNode(
-                        name=func_node.name,
-                        qname=method_qname,
-                        properties=FunctionProperties(
-                            position=NodePosition(
-                                line_no=func_node.lineno,
-                                col_offset=func_node.col_offset,
-                                end_line_no=func_node.end_lineno,
-                                end_col_offset=func_node.end_col_offset,
-                            )
-                        )
-                    ))
-                    processed_funcs.add(func_node)
-
-        # Process remaining functions (not methods)
-        for func_node in visitor.declared_functions:
-            if func_node not in processed_funcs:
-                func_qname = self._get_qname(file_path, [func_node.name])
+            for func_node in methods.get(class_node, ()):
+                method_qname = f"{class_qname}.{func_node.name}"
                 nodes.append(FunctionNode(
                     name=func_node.name,
-                    qname=func_qname,
+                    qname=method_qname,
                     properties=FunctionProperties(
                         position=NodePosition(
                             line_no=func_node.lineno,
@@ -100,6 +247,22 @@ class PythonFileParser:
                         )
                     )
                 ))
+
+        # Process remaining functions (not methods)
+        for func_node in module_functions:
+            func_qname = module_prefix + func_node.name
+            nodes.append(FunctionNode(
+                name=func_node.name,
+                qname=func_qname,
+                properties=FunctionProperties(
+                    position=NodePosition(
+                        line_no=func_node.lineno,
+                        col_offset=func_node.col_offset,
+                        end_line_no=func_node.end_lineno,
+                        end_col_offset=func_node.end_col_offset,
+                    )
+                )
+            ))
         
         return nodes
     
@@ -122,12 +285,12 @@ class PythonFileParser:
         if tree is None:
             # If AST is not cached, try to parse the file again
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                tree = ast.parse(content, filename=file_path)
-                self.ast_cache.set(file_path, tree)
-            except (OSError, SyntaxError) as e:
-                print(f"Error parsing {file_path} in detail pass: {e}")
+                with read_source(file_path) as content:
+                    tree = self.ast_cache.parse(file_path, content)
+            except Exception as e:
+                # Includes RecursionError from ast.parse on a deeply nested
+                # expression; one such file must not abort the whole scan
+                logger.error("Error parsing %s in detail pass: %s", file_path, e)
                 return []
         
         # Create visitor context for the detail analysis pipeline
@@ -142,7 +305,11 @@ class PythonFileParser:
         
         # Phase 2: Dependency Resolution
         dependency_visitor = DependencyVisitor(context)
-        dependency_visitor.visit(tree)
+        try:
+            dependency_visitor.visit(tree)
+        except Exception as e:
+            logger.error("Error analyzing dependencies in %s: %s", file_path, e)
+            return []
         
         # Future phases will add:
         # Phase 3: Control Flow Analysis
@@ -172,4 +339,4 @@ class PythonFileParser:
         Returns:
             List of file paths with cached ASTs
         """
-        return list(self.ast_cache._cache.keys())
+        return self.ast_cache.cached_files()
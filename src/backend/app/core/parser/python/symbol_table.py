@@ -1,5 +1,6 @@
 # src/backend/app/core/parser/python/symbol_table.py
-from typing import Dict, List, Optional
+import sys
+from typing import Dict, List, Optional, Set
 
 class SymbolTable:
     """
@@ -9,12 +10,29 @@ class SymbolTable:
     """
     def __init__(self):
         self._qname_to_id: Dict[str, str] = {}
+        # Every dotted prefix of every known qname ("a", "a.b", "a.b.c")
+        self._known_prefixes: Set[str] = set()
         self._file_id_to_imports: Dict[str, Dict[str, str]] = {}
         self._scope_stack: List[str] = []
 
     def add_symbol(self, qname: str, db_id: str) -> None:
         """Caches a symbol's qname and its database ID."""
+        # Interned keys let lookups with the same object match by identity
+        # before any character comparison
+        qname = sys.intern(qname)
         self._qname_to_id[qname] = db_id
+        known_prefixes = self._known_prefixes
+        if qname in known_prefixes:
+            return
+        known_prefixes.add(qname)
+        end = qname.rfind('.')
+        while end != -1:
+            prefix = qname[:end]
+            if prefix in known_prefixes:
+                # Shorter prefixes were added along with this one
+                break
+            known_prefixes.add(prefix)
+            end = qname.rfind('.', 0, end)
 
     def add_import(self, file_id: str, alias: str, qname: str) -> None:
         """
@@ -71,23 +89,18 @@ class SymbolTable:
         # 2. 'myproject.utils' (module containing the symbol)
         # 3. 'myproject' (parent module)
         
-        # First check exact match
-        if qname in self._qname_to_id:
+        # An exact match, or a known qname starting with this one (importing
+        # a module that contains other modules we know about), is a single
+        # lookup in the prefix set
+        if qname in self._known_prefixes:
             return True
         
         # Then check prefixes (for cases like myproject.utils.function_name)
-        parts = qname.split('.')
-        for i in range(len(parts)):
-            prefix = '.'.join(parts[:i+1])
-            if prefix in self._qname_to_id:
-                return True
-        
-        # Check if any known qname starts with this qname as a prefix
-        # This handles cases where we're importing a module that contains 
-        # other modules we know about
-        for known_qname in self._qname_to_id.keys():
-            if known_qname.startswith(qname + '.'):
+        end = qname.find('.')
+        while end != -1:
+            if qname[:end] in self._qname_to_id:
                 return True
+            end = qname.find('.', end + 1)
         
         return False
     
@@ -112,7 +125,7 @@ class SymbolTable:
         
         # Create a placeholder ID that will be resolved during scanning
         placeholder_id = f"package_{package_qname.replace('.', '_')}"
-        self._qname_to_id[package_qname] = placeholder_id
+        self.add_symbol(package_qname, placeholder_id)
         
         return placeholder_id
     
@@ -0,0 +1,50 @@
+# src/backend/app/core/parser/python/visitors/base_visitor.py
+import ast
+from typing import Any, Callable, ClassVar, Dict, Type
+
+
+class CachedDispatchVisitor(ast.NodeVisitor):
+    """
+    An ``ast.NodeVisitor`` that resolves ``visit_<NodeType>`` handlers once
+    per node type and caches them in a per-class table.
+
+    The stock visitor builds the method name and calls ``getattr`` for every
+    node it visits; here dispatch is a single dict lookup on ``type(node)``.
+    Subclasses define handlers exactly as they would for ``ast.NodeVisitor``.
+    """
+    _dispatch: ClassVar[Dict[Type[ast.AST], Callable[[Any, ast.AST], Any]]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Each subclass gets its own table since handlers may be overridden
+        cls._dispatch = {}
+
+    @classmethod
+    def _resolve(
+        cls, node_type: Type[ast.AST]
+    ) -> Callable[[Any, ast.AST], Any]:
+        """Returns the handler for ``node_type``, caching it on first use."""
+        handler = cls._dispatch.get(node_type)
+        if handler is None:
+            handler = getattr(
+                cls, "visit_" + node_type.__name__, cls.generic_visit
+            )
+            cls._dispatch[node_type] = handler
+        return handler
+
+    def visit(self, node: ast.AST) -> Any:
+        handler = self._dispatch.get(type(node))
+        if handler is None:
+            handler = self._resolve(type(node))
+        return handler(self, node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        visit = self.visit
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if type(value) is list:
+                for item in value:
+                    if isinstance(item, ast.AST):
+                        visit(item)
+            elif isinstance(value, ast.AST):
+                visit(value)
@@ -1,32 +1,80 @@
 # src/backend/app/core/parser/python/visitors/declaration_visitor.py
 import ast
 from typing import List, Union
+from .base_visitor import CachedDispatchVisitor
 
-class DeclarationVisitor(ast.NodeVisitor):
+# Signals a handler returns to steer the walk
+CONTINUE = 0
+SKIP_SUBTREE = 1
+
+# Node types whose lists hold statements. Functions, classes and imports are
+# statements, so only these lists need walking; expressions never hold them.
+_STATEMENT_TYPES = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+class DeclarationVisitor(CachedDispatchVisitor):
     """
     A visitor that collects all function, class, and import declarations
     from a file's AST in the first pass.
+
+    The walk uses an explicit stack and descends only into statement lists,
+    in the same pre-order ``ast.NodeVisitor`` would visit them. Handlers are
+    looked up through the shared ``CachedDispatchVisitor`` table, and each
+    returns ``CONTINUE`` or ``SKIP_SUBTREE`` to say whether the node's
+    children are walked.
     """
     def __init__(self):
         self.declared_functions: List[ast.FunctionDef] = []
         self.declared_classes: List[ast.ClassDef] = []
         self.imports: List[Union[ast.Import, ast.ImportFrom]] = []
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+    def visit(self, node: ast.AST) -> None:
+        dispatch = self._dispatch
+        resolve = self._resolve
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            handler = dispatch.get(type(node))
+            if handler is None:
+                handler = resolve(type(node))
+            if handler(self, node) == SKIP_SUBTREE:
+                continue
+
+            children = []
+            for field in node._fields:
+                value = getattr(node, field, None)
+                if (
+                    type(value) is list
+                    and value
+                    and isinstance(value[0], _STATEMENT_TYPES)
+                ):
+                    children.extend(value)
+            # Reversed so children pop off the stack in source order
+            children.reverse()
+            stack.extend(children)
+
+    def generic_visit(self, node: ast.AST) -> int:
+        """Nodes without a handler are walked; ``visit`` pushes their children."""
+        return CONTINUE
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> int:
         """Identifies a function definition."""
         self.declared_functions.append(node)
-        # We do not call generic_visit here to avoid traversing into the function body
+        # Function bodies are not traversed
+        return SKIP_SUBTREE
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+    def visit_ClassDef(self, node: ast.ClassDef) -> int:
         """Identifies a class definition."""
         self.declared_classes.append(node)
-        # We call generic_visit to find nested methods and classes
-        self.generic_visit(node)
+        # Class bodies are traversed to find nested methods and classes
+        return CONTINUE
 
-    def visit_Import(self, node: ast.Import) -> None:
+    def visit_Import(self, node: ast.Import) -> int:
         """Identifies an 'import ...' statement."""
         self.imports.append(node)
+        return SKIP_SUBTREE
 
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> int:
         """Identifies a 'from ... import ...' statement."""
         self.imports.append(node)
+        return SKIP_SUBTREE
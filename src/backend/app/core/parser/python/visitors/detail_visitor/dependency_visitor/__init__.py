@@ -7,13 +7,15 @@ and context management.
 """
 
 import ast
+from collections import Counter
+from ...base_visitor import CachedDispatchVisitor
 from ..visitor_context import VisitorContext
 from .import_processor import ImportProcessor
 from .context_manager import DependencyContextManager
 from .usage_detector import UsageDetector
 
 
-class DependencyVisitor(ast.NodeVisitor):
+class DependencyVisitor(CachedDispatchVisitor):
     """
     A visitor to resolve all import statements and create dependency edges.
     
@@ -120,18 +122,14 @@ class DependencyVisitor(ast.NodeVisitor):
         """
         processed_imports = self.import_processor.get_processed_imports()
         has_consumer = self.context_manager.has_current_consumer()
+        # Tally both import kinds in a single pass
+        import_counts = Counter(type(imp) for imp in processed_imports)
         
         return {
             "total_imports_processed": len(processed_imports),
             "import_types": {
-                "regular_imports": sum(
-                    1 for imp in processed_imports 
-                    if isinstance(imp, ast.Import)
-                ),
-                "from_imports": sum(
-                    1 for imp in processed_imports 
-                    if isinstance(imp, ast.ImportFrom)
-                )
+                "regular_imports": import_counts[ast.Import],
+                "from_imports": import_counts[ast.ImportFrom]
             },
             "has_active_consumer": has_consumer,
             "total_edges_created": len(self.context.results)
@@ -1,11 +1,14 @@
 """
 The Project domain object, representing the root of a code graph.
 """
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from .base import DomainObject
 from .file import File
 from .folder import Folder
+from .qname import path_to_qname
+from .tree_builder import assemble_tree
 from ..models import node, edges, properties
+from ..models.shared import ZERO_POSITION
 from ..db import collections as db
 
 
@@ -14,6 +17,8 @@ class Project(DomainObject[node.ProjectNode]):
     A domain object representing a project, which is the root container for
     all other code elements in the graph.
     """
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return self.model.name
@@ -26,54 +31,92 @@ class Project(DomainObject[node.ProjectNode]):
     def absolute_path(self) -> str:
         return self.path + self.name
 
-    def add_file(self, file_name: str, file_path: str) -> File:
-        """Adds a new file directly to the project's root."""
+    def prepare_file(
+        self, file_name: str, file_path: str
+    ) -> Tuple[node.FileNode, edges.ContainsEdge]:
+        """
+        Builds the FileNode for a new file in this project and the
+        ContainsEdge linking to it, without storing either. The node's key
+        is pre-allocated so both can be inserted together or in bulk.
+        """
         # Generate qname following the dot notation pattern
-        file_qname = file_path.replace(self.path, "").lstrip("/").replace(".py", "").replace("/", ".")
+        file_qname = path_to_qname(file_path, self.path)
         
         # 1. Create the FileNode model
+        file_key = db.nodes.new_key()
         file_node_model = node.FileNode(
+            _key=file_key,
+            _id=db.nodes.document_id(file_key),
             name=file_name,
             qname=file_qname,
             node_type="file",
             properties=properties.FileProperties(path=file_path)
         )
-        created_file_node = db.nodes.create(file_node_model)
 
         # 2. Create the ContainsEdge to link it to this project
         contains_edge_model = edges.ContainsEdge(
             _from=self.id,
-            _to=created_file_node.id,
-            position=node.NodePosition(line_no=0, col_offset=0, end_line_no=0, end_col_offset=0)
+            _to=file_node_model.id,
+            position=ZERO_POSITION
+        )
+        return file_node_model, contains_edge_model
+
+    def add_file(self, file_name: str, file_path: str) -> File:
+        """Adds a new file directly to the project's root."""
+        file_node_model, contains_edge_model = self.prepare_file(
+            file_name, file_path
+        )
+        # Stored with the node in one request
+        created_file_node = db.nodes.create_linked(
+            file_node_model, db.contains_edges, contains_edge_model
         )
-        db.contains_edges.create(contains_edge_model)
 
-        # 3. Return the hydrated File domain object
+        # Return the hydrated File domain object
         return File(created_file_node)
 
-    def add_folder(self, folder_name: str, folder_path: str) -> Folder:
-        """Adds a new folder directly to the project's root."""
+    def prepare_folder(
+        self, folder_name: str, folder_path: str
+    ) -> Tuple[node.FolderNode, edges.ContainsEdge]:
+        """
+        Builds the FolderNode for a new folder in this project and the
+        ContainsEdge linking to it, without storing either. The node's key
+        is pre-allocated so both can be inserted together or in bulk.
+        """
         # Generate qname following the dot notation pattern
-        folder_qname = folder_path.replace(self.path, "").lstrip("/").replace("/", ".")
+        folder_qname = path_to_qname(
+            folder_path, self.path, strip_suffix=False
+        )
         
         # 1. Create the FolderNode model
+        folder_key = db.nodes.new_key()
         folder_node_model = node.FolderNode(
+            _key=folder_key,
+            _id=db.nodes.document_id(folder_key),
             name=folder_name,
             qname=folder_qname,
             node_type="folder",
             properties=properties.FolderProperties(path=folder_path)
         )
-        created_folder_node = db.nodes.create(folder_node_model)
 
         # 2. Create the ContainsEdge to link it to this project
         contains_edge_model = edges.ContainsEdge(
             _from=self.id,
-            _to=created_folder_node.id,
-            position=node.NodePosition(line_no=0, col_offset=0, end_line_no=0, end_col_offset=0)
+            _to=folder_node_model.id,
+            position=ZERO_POSITION
         )
-        db.contains_edges.create(contains_edge_model)
+        return folder_node_model, contains_edge_model
 
-        # 3. Return the hydrated Folder domain object
+    def add_folder(self, folder_name: str, folder_path: str) -> Folder:
+        """Adds a new folder directly to the project's root."""
+        folder_node_model, contains_edge_model = self.prepare_folder(
+            folder_name, folder_path
+        )
+        # Stored with the node in one request
+        created_folder_node = db.nodes.create_linked(
+            folder_node_model, db.contains_edges, contains_edge_model
+        )
+
+        # Return the hydrated Folder domain object
         return Folder(created_folder_node)
 
     def get_files(self) -> list[File]:
@@ -99,25 +142,4 @@ class Project(DomainObject[node.ProjectNode]):
         Retrieves all descendants of this folder and formats them as a tree.
         """
         cursor = db.contains_edges.get_descendant_tree_query(self.id)
-        
-        node_map = {self.id: {"node": self.model.model_dump(), "children": []}}
-        
-        for item in cursor:
-            node_data = item['vertex']
-            parent_id = item['parent_id']
-            
-            node_id = node_data['_id']
-            if node_id not in node_map:
-                node_map[node_id] = {"node": node_data, "children": []}
-            
-            if parent_id in node_map:
-                node_map[parent_id]["children"].append(node_map[node_id])
-            
-        def build_tree(node_id):
-            node_info = node_map[node_id]
-            return {
-                **node_info["node"],
-                "children": [build_tree(child["node"]["_id"]) for child in node_info["children"]]
-            }
-
-        return build_tree(self.id)
\ No newline at end of file
+        return assemble_tree(self.id, self.model.model_dump(), cursor)
@@ -0,0 +1,25 @@
+"""
+Helpers for deriving dotted qualified names from file system paths.
+"""
+
+# Both separators map to "." so Windows-style paths give the same qname
+_SEP_TO_DOT = str.maketrans({"/": ".", "\\": "."})
+
+
+def path_to_qname(path: str, base: str = "", strip_suffix: bool = True) -> str:
+    """
+    Converts ``path`` into a dotted qname relative to ``base``.
+
+    The base is sliced off only when ``path`` starts with it, and only a
+    trailing ``.py`` is dropped, so names like ``foo.pyx`` stay intact.
+
+    Example:
+        path_to_qname("/project/src/utils/helper.py", "/project")
+        -> "src.utils.helper"
+    """
+    if base and path.startswith(base):
+        path = path[len(base):]
+    path = path.lstrip("/\\")
+    if strip_suffix and path.endswith(".py"):
+        path = path[:-3]
+    return path.translate(_SEP_TO_DOT)
@@ -2,7 +2,7 @@
 Tree building utilities for creating hierarchical structures from file paths.
 """
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List
 
 
 def build_tree_from_paths(
@@ -33,25 +33,26 @@ def build_tree_from_paths(
         }
     """
     tree = {}
+    # Folder path -> its dict, so files sharing a folder skip the descent
+    folder_dicts = {"": tree}
     
     for path in paths:
         # Remove base path prefix and clean the path
-        if base_path:
-            relative_path = path.replace(base_path, "").lstrip("/")
-        else:
-            relative_path = path.lstrip("/")
+        if base_path and path.startswith(base_path):
+            path = path[len(base_path):]
+        relative_path = path.lstrip("/")
             
         if not relative_path:
             continue
             
-        parts = relative_path.split("/")
-        current = tree
-        
-        for i, part in enumerate(parts):
-            if i == len(parts) - 1:  # It's a file
-                current.setdefault(part, None)
-            else:  # It's a folder
+        folder, _, file_name = relative_path.rpartition("/")
+        current = folder_dicts.get(folder)
+        if current is None:
+            current = tree
+            for part in folder.split("/"):
                 current = current.setdefault(part, {})
+            folder_dicts[folder] = current
+        current.setdefault(file_name, None)
                 
     return tree
 
@@ -114,4 +115,24 @@ def get_tree_folders(tree: Dict[str, Any], base_path: str = "") -> List[str]:
             folders.append(current_path)
             folders.extend(get_tree_folders(subtree, current_path))
             
-    return folders 
\ No newline at end of file
+    return folders 
+
+
+def assemble_tree(
+    root_id: str, root: Dict[str, Any], rows: Iterable[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Nests ``{"parent_id", "children"}`` traversal rows under ``root``.
+
+    The server has already grouped the children of each parent, so every
+    vertex dict just has its group attached in place as ``children``; the
+    walk uses an explicit stack rather than recursion.
+    """
+    children_of = {row["parent_id"]: row["children"] for row in rows}
+    root["children"] = children_of.get(root_id, [])
+    stack = list(root["children"])
+    while stack:
+        node_data = stack.pop()
+        children = node_data["children"] = children_of.get(node_data["_id"], [])
+        stack.extend(children)
+    return root
@@ -33,6 +33,31 @@ def get_db() -> StandardDatabase:
             
     return _db_connection
 
+def close_db() -> None:
+    """
+    Closes the shared client's HTTP session and forgets the memoized
+    connection, so the next get_db() call starts fresh.
+    """
+    global _client, _db_connection
+    if _client is not None:
+        _client.close()
+    _client = None
+    _db_connection = None
+
+def enable_query_cache(db: StandardDatabase, max_results: int = 1024) -> bool:
+    """
+    Switches the server's AQL results cache to on-demand mode if it is off,
+    so queries executed with ``cache=True`` are answered from it until a
+    collection they read is written to.
+
+    The mode is server-wide, so an operator's "on" or "demand" setting is
+    left as it is. Returns True if the mode was changed.
+    """
+    if db.aql.cache.properties().get("mode") != "off":
+        return False
+    db.aql.cache.configure(mode="demand", max_results=max_results)
+    return True
+
 # For application-level dependency injection, if needed
 def get_db_dependency() -> StandardDatabase:
     return get_db()
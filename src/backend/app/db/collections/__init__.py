@@ -9,9 +9,11 @@ from ...models import node, edges
 # ==============================================================================
 
 # A single collection for all node types, distinguished by the 'node_type' field.
+# Indexed on the attributes used for lookups so they avoid full scans.
 nodes = ArangoNodeCollection[node.Node](
     collection_name="nodes",
-    model=node.Node
+    model=node.Node,
+    indexes=[["node_type"], ["qname"], ["project_id"]]
 )
 
 # ==============================================================================
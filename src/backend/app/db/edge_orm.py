@@ -1,14 +1,26 @@
 # src/backend/app/db/edge_orm.py
 
-from typing import Type, TypeVar, Generic, List, Dict, Any
+from typing import Type, TypeVar, Generic, Iterator, Dict, Any, List
 from pydantic import BaseModel
 from arango.collection import StandardCollection
 from arango.database import StandardDatabase
 from .client import get_db
+from .filters import count_matching
 from ..models.base import BaseEdge
 
 T = TypeVar('T', bound=BaseEdge)
 
+# Built once at import; the start node is passed as a bind variable so the
+# query string stays constant and ArangoDB can reuse its plan.
+# Descendants are grouped by parent on the server, so one row arrives per
+# parent rather than one per vertex.
+_DESCENDANT_TREE_AQL = """
+FOR v, e, p IN 1..100 OUTBOUND @start_node_id @@edge_collection
+    OPTIONS { bfs: true, uniqueVertices: "global" }
+    COLLECT parent_id = p.vertices[-2]._id INTO children = v
+    RETURN { "parent_id": parent_id, "children": children }
+"""
+
 class ArangoEdgeCollection(Generic[T]):
     """
     A generic, typed wrapper around an ArangoDB edge collection that handles
@@ -61,9 +73,42 @@ class ArangoEdgeCollection(Generic[T]):
         Inserts a new edge from a Pydantic model.
         """
         dump = edge_data.model_dump(by_alias=True, exclude_none=True)
-        meta = self.collection.insert(dump, overwrite=True)
-        new_doc = self.collection.get(meta["_key"])
-        return self._validate(new_doc)
+        # return_new hands back the stored document, saving a follow-up get
+        meta = self.collection.insert(dump, overwrite=True, return_new=True)
+        return self._validate(meta["new"])
+
+    def create_many(self, edges: List[T]) -> List[T]:
+        """
+        Inserts several edges in a single request and returns them in order.
+        """
+        if not edges:
+            return []
+        dumps = [
+            edge.model_dump(by_alias=True, exclude_none=True) for edge in edges
+        ]
+        results = self.collection.insert_many(
+            dumps, overwrite=True, return_new=True
+        )
+        created = []
+        for result in results:
+            # insert_many reports per-document failures in place
+            if isinstance(result, Exception):
+                raise result
+            created.append(self._validate(result["new"]))
+        return created
+
+    def insert_many(self, edges: List[T]) -> None:
+        """
+        Inserts several edges in a single request without reading them back.
+        """
+        if not edges:
+            return
+        dumps = [
+            edge.model_dump(by_alias=True, exclude_none=True) for edge in edges
+        ]
+        self.collection.insert_many(
+            dumps, overwrite=True, raise_on_document_error=True
+        )
     
     def update(self, edge_data: T) -> T:
         """
@@ -79,16 +124,37 @@ class ArangoEdgeCollection(Generic[T]):
         cursor = self.collection.find(filters, limit=limit)
         return [self._validate(doc) for doc in cursor]
 
+    def count(self, filters: dict | None = None) -> int:
+        """
+        Counts edges matching a filter dictionary on the server, without
+        transferring them.
+        """
+        if not filters:
+            return self.collection.count()
+        return count_matching(self.db, self.collection_name, filters)
+
     def truncate(self):
         """Deletes all edges in the collection."""
         self.collection.truncate()
 
-    def get_descendant_tree_query(self, start_node_id: str) -> List[Dict[str, Any]]:
-        """
-        Executes a graph traversal to fetch all descendants of a start node.
+    def get_descendant_tree_query(
+        self, start_node_id: str, batch_size: int = 500
+    ) -> Iterator[Dict[str, Any]]:
         """
-        aql = f"""
-        FOR v, e, p IN 1..100 OUTBOUND '{start_node_id}' {self.collection_name}
-            RETURN {{ "vertex": v, "parent_id": p.vertices[-2]._id }}
+        Executes a graph traversal to fetch all descendants of a start node,
+        yielding ``{"parent_id", "children"}`` rows, one per parent.
+
+        Results are streamed from the server cursor `batch_size` rows at a
+        time rather than materialized as one list.
         """
-        return list(self.db.aql.execute(aql))
\ No newline at end of file
+        bind_vars = {
+            "start_node_id": start_node_id,
+            "@edge_collection": self.collection_name
+        }
+        cursor = self.db.aql.execute(
+            _DESCENDANT_TREE_AQL,
+            bind_vars=bind_vars,
+            batch_size=batch_size,
+            cache=True
+        )
+        yield from cursor
\ No newline at end of file
@@ -0,0 +1,39 @@
+# src/backend/app/db/filters.py
+from typing import Any, Dict, Tuple
+from arango.database import StandardDatabase
+
+
+def build_filter_clause(filters: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Turns an equality filter dictionary into AQL ``FILTER`` lines on ``doc``.
+
+    Each key becomes its own ``doc.@attrN == @valN`` condition, which the
+    optimizer can serve from a persistent index on that attribute, unlike
+    ``MATCHES(doc, @filters)``. Returns the clause and its bind variables.
+    """
+    lines = []
+    bind_vars: Dict[str, Any] = {}
+    for i, (attribute, value) in enumerate(filters.items()):
+        lines.append(f"FILTER doc.@attr{i} == @val{i}")
+        bind_vars[f"attr{i}"] = attribute
+        bind_vars[f"val{i}"] = value
+    return "\n    ".join(lines), bind_vars
+
+
+def count_matching(
+    db: StandardDatabase, collection_name: str, filters: Dict[str, Any]
+) -> int:
+    """
+    Counts documents in ``collection_name`` equal to ``filters`` on every
+    key, on the server and without transferring them.
+    """
+    clause, bind_vars = build_filter_clause(filters)
+    query = f"""
+FOR doc IN @@collection
+    {clause}
+    COLLECT WITH COUNT INTO total
+    RETURN total
+"""
+    bind_vars["@collection"] = collection_name
+    cursor = db.aql.execute(query, bind_vars=bind_vars)
+    return next(cursor, 0)
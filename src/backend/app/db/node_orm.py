@@ -1,30 +1,83 @@
 # src/backend/app/db/node_orm.py
 
-from typing import Type, TypeVar, Generic, Union, get_origin, Optional
+from typing import (
+    Type, TypeVar, Generic, Union, get_origin, Optional, List, Iterable, Dict
+)
+from uuid import uuid4
 from pydantic import TypeAdapter
 from arango.collection import StandardCollection
 from arango.exceptions import DocumentGetError
 from arango.database import StandardDatabase
 from .client import get_db
-from ..models.base import ArangoBase
+from .filters import count_matching
+from ..models.base import ArangoBase, BaseEdge
 from .edge_orm import ArangoEdgeCollection
 
 T = TypeVar('T', bound=ArangoBase)
 
+# ------------------------------------------------------------------------------
+# AQL templates, built once at import. Only bind variables change per call,
+# so ArangoDB sees identical query strings and can reuse its query plans.
+# ------------------------------------------------------------------------------
+_FIND_RELATED_AQL = {
+    (direction, filtered): (
+        f"FOR node IN 1..1 {direction.upper()} @start_node_id @@edge_collection"
+        + ' OPTIONS { bfs: true, uniqueVertices: "global" }'
+        + (" FILTER node.node_type == @node_type" if filtered else "")
+        + " RETURN node"
+    )
+    for direction in ("outbound", "inbound", "any")
+    for filtered in (False, True)
+}
+
+_GROUPED_CHILDREN_AQL = """
+FOR node IN 1..1 OUTBOUND @start_node_id @@edge_collection
+    OPTIONS { bfs: true, uniqueVertices: "global" }
+    FILTER node.node_type IN @node_types
+    COLLECT node_type = node.node_type INTO group
+    RETURN { node_type: node_type, nodes: group[*].node }
+"""
+
+# Both writes run in one request; the edge can reference the new document
+# because its key is allocated client-side before the query is sent.
+_CREATE_LINKED_AQL = """
+LET doc = FIRST(
+    INSERT @doc INTO @@collection OPTIONS { overwriteMode: "replace" }
+    RETURN NEW
+)
+INSERT @edge INTO @@edge_collection
+RETURN doc
+"""
+
+_ALL_DESCENDANTS_AQL = """
+FOR node IN 1..10 OUTBOUND @start_node_id @@edge_collection
+    OPTIONS { bfs: true, uniqueVertices: "global" }
+    RETURN node
+"""
+
 
 class ArangoNodeCollection(Generic[T]):
     """
     A generic, typed wrapper around an ArangoDB document collection that
     handles Pydantic model validation, creation, and retrieval.
     """
-    def __init__(self, collection_name: str, model: Type[T]):
+    def __init__(
+        self,
+        collection_name: str,
+        model: Type[T],
+        indexes: Optional[List[List[str]]] = None
+    ):
         self.collection_name = collection_name
         self.model = model
+        # Persistent indexes (lists of fields) ensured on first access
+        self.indexes = indexes or []
         
         if get_origin(model) is Union or hasattr(model, '__metadata__'):
             self.adapter = TypeAdapter(model)
         else:
             self.adapter = None
+        # Built once: validates and dumps whole result sets in a single call
+        self.list_adapter = TypeAdapter(List[model])
 
         self._collection: StandardCollection | None = None
 
@@ -46,17 +99,31 @@ class ArangoNodeCollection(Generic[T]):
             return self.adapter.validate_python(doc)
         return self.model.model_validate(doc)
 
+    def _validate_many(self, docs: Iterable[dict]) -> List[T]:
+        """Validate a batch of documents with the precompiled list adapter."""
+        return self.list_adapter.validate_python(list(docs))
+
     def _get_or_create_collection(self) -> StandardCollection:
         """
-        Retrieves the document collection or creates it if it doesn't exist.
+        Retrieves the document collection or creates it if it doesn't exist,
+        then ensures the configured indexes are present.
         """
+        collection = None
         if self.db.has_collection(self.collection_name):
             collection = self.db.collection(self.collection_name)
-            if not collection.properties()['edge']:
-                return collection
-            self.db.delete_collection(self.collection_name)
+            if collection.properties()['edge']:
+                self.db.delete_collection(self.collection_name)
+                collection = None
 
-        return self.db.create_collection(self.collection_name, edge=False)
+        if collection is None:
+            collection = self.db.create_collection(
+                self.collection_name, edge=False
+            )
+
+        for fields in self.indexes:
+            # Idempotent: ArangoDB returns the existing index if it matches
+            collection.add_index({"type": "persistent", "fields": fields})
+        return collection
 
     def get(self, key: str) -> T | None:
         """
@@ -74,9 +141,77 @@ class ArangoNodeCollection(Generic[T]):
         Inserts a new document from a Pydantic model.
         """
         dump = doc_data.model_dump(by_alias=True, exclude_none=True)
-        meta = self.collection.insert(dump, overwrite=True)
-        new_doc = self.collection.get(meta["_key"])
-        return self._validate(new_doc)
+        # return_new hands back the stored document, saving a follow-up get
+        meta = self.collection.insert(dump, overwrite=True, return_new=True)
+        return self._validate(meta["new"])
+
+    @staticmethod
+    def new_key() -> str:
+        """Allocates a document key client-side, ahead of insertion."""
+        return uuid4().hex
+
+    def document_id(self, key: str) -> str:
+        """Returns the ``_id`` a document with ``key`` has in this collection."""
+        return f"{self.collection_name}/{key}"
+
+    def create_linked(
+        self,
+        doc_data: T,
+        edge_collection: "ArangoEdgeCollection",
+        edge_data: BaseEdge
+    ) -> T:
+        """
+        Inserts a document together with an edge that references it, in a
+        single request. ``doc_data`` must carry a key from ``new_key()`` so
+        the edge can be built against ``document_id(key)`` beforehand.
+        """
+        if not doc_data.key:
+            raise ValueError("create_linked requires a pre-allocated key.")
+        # Touch both collections so they exist before AQL references them
+        self.collection
+        edge_collection.collection
+        bind_vars = {
+            "doc": doc_data.model_dump(by_alias=True, exclude_none=True),
+            "edge": edge_data.model_dump(by_alias=True, exclude_none=True),
+            "@collection": self.collection_name,
+            "@edge_collection": edge_collection.collection_name
+        }
+        cursor = self.db.aql.execute(_CREATE_LINKED_AQL, bind_vars=bind_vars)
+        return self._validate(next(cursor))
+
+    def create_many(self, docs: List[T]) -> List[T]:
+        """
+        Inserts several documents in a single request and returns them in
+        order.
+        """
+        if not docs:
+            return []
+        dumps = self.list_adapter.dump_python(
+            docs, by_alias=True, exclude_none=True
+        )
+        results = self.collection.insert_many(
+            dumps, overwrite=True, return_new=True
+        )
+        for result in results:
+            # insert_many reports per-document failures in place
+            if isinstance(result, Exception):
+                raise result
+        return self._validate_many(result["new"] for result in results)
+
+    def insert_many(self, docs: List[T]) -> None:
+        """
+        Inserts several documents in a single request without reading them
+        back. For documents whose keys were pre-allocated with ``new_key()``
+        and whose stored form is not needed.
+        """
+        if not docs:
+            return
+        dumps = self.list_adapter.dump_python(
+            docs, by_alias=True, exclude_none=True
+        )
+        self.collection.insert_many(
+            dumps, overwrite=True, raise_on_document_error=True
+        )
     
     def update(self, doc_data: T) -> T:
         """
@@ -90,7 +225,7 @@ class ArangoNodeCollection(Generic[T]):
         Finds documents using a filter dictionary.
         """
         cursor = self.collection.find(filters, limit=limit)
-        return [self._validate(doc) for doc in cursor]
+        return self._validate_many(cursor)
 
     def find_one(self, filters: dict) -> T | None:
         """
@@ -104,12 +239,26 @@ class ArangoNodeCollection(Generic[T]):
         except StopIteration:
             return None
 
-    def aql(self, query: str, bind_vars: dict | None = None) -> list[T]:
+    def aql(
+        self, query: str, bind_vars: dict | None = None, cache: bool = False
+    ) -> list[T]:
         """
         Executes a raw AQL query and validates the results against the model.
+
+        Pass ``cache=True`` for read-only queries to serve repeats from the
+        server's query results cache.
         """
-        cursor = self.db.aql.execute(query, bind_vars=bind_vars)
-        return [self._validate(doc) for doc in cursor]
+        cursor = self.db.aql.execute(query, bind_vars=bind_vars, cache=cache)
+        return self._validate_many(cursor)
+
+    def count(self, filters: dict | None = None) -> int:
+        """
+        Counts documents matching a filter dictionary on the server, without
+        transferring them.
+        """
+        if not filters:
+            return self.collection.count()
+        return count_matching(self.db, self.collection_name, filters)
 
     def truncate(self):
         """Deletes all documents in the collection."""
@@ -120,7 +269,7 @@ class ArangoNodeCollection(Generic[T]):
         Finds documents using a filter dictionary.
         """
         cursor = self.collection.find(filters, limit=limit)
-        return [self._validate(doc) for doc in cursor]
+        return self._validate_many(cursor)
     
     def find_related(
         self,
@@ -137,22 +286,41 @@ class ArangoNodeCollection(Generic[T]):
                 "Direction must be 'outbound', 'inbound', or 'any'."
             )
 
-        query = f"""
-        FOR node IN 1..1 {direction.upper()} @start_node_id @@edge_collection
-        """
+        query = _FIND_RELATED_AQL[(direction, bool(filter_by_type))]
         bind_vars = {
             "start_node_id": start_node_id,
             "@edge_collection": edge_collection.collection_name
         }
 
         if filter_by_type:
-            query += " FILTER node.node_type == @node_type"
             bind_vars["node_type"] = filter_by_type
-        
-        query += " RETURN node"
 
-        return self.aql(query, bind_vars)
+        return self.aql(query, bind_vars, cache=True)
         
+    def find_related_grouped(
+        self,
+        start_node_id: str,
+        edge_collection: "ArangoEdgeCollection",
+        node_types: List[str]
+    ) -> Dict[str, list[T]]:
+        """
+        Finds the direct outbound neighbours of several node types in one
+        query, grouped by ``node_type``. Every requested type is present in
+        the result, empty if nothing matched.
+        """
+        bind_vars = {
+            "start_node_id": start_node_id,
+            "@edge_collection": edge_collection.collection_name,
+            "node_types": node_types
+        }
+        cursor = self.db.aql.execute(
+            _GROUPED_CHILDREN_AQL, bind_vars=bind_vars, cache=True
+        )
+        grouped = {node_type: [] for node_type in node_types}
+        for row in cursor:
+            grouped[row["node_type"]] = self._validate_many(row["nodes"])
+        return grouped
+
     def __getitem__(self, key: str) -> T | None:
         return self.get(key)
 
@@ -162,12 +330,8 @@ class ArangoNodeCollection(Generic[T]):
         """
         Retrieves all descendants of a starting node.
         """
-        query = """
-        FOR node IN 1..10 OUTBOUND @start_node_id @@edge_collection
-            RETURN node
-        """
         bind_vars = {
             "start_node_id": start_node_id,
             "@edge_collection": edge_collection.collection_name
         }
-        return self.aql(query, bind_vars)
\ No newline at end of file
+        return self.aql(_ALL_DESCENDANTS_AQL, bind_vars, cache=True)
\ No newline at end of file
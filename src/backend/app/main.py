@@ -1,7 +1,7 @@
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from .api import root, health
-from .db.client import get_db
+from .db.client import get_db, close_db, enable_query_cache
 
 
 from contextlib import asynccontextmanager
@@ -20,11 +20,17 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"❌ Database connection failed: {e}")
         raise
+    try:
+        enable_query_cache(db)
+    except Exception as e:
+        # Needs server-level rights; reads still work, just uncached
+        print(f"⚠️ Query results cache not enabled: {e}")
     
     yield
     
     # Shutdown
     print("🔄 Shutting down database connections...")
+    close_db()
 
 app = FastAPI(
     title="V-NOC API",
@@ -22,8 +22,12 @@ class BaseNode(ArangoBase):
     A base model for all node documents, ensuring a 'node_type' field
     is always present to distinguish between different types of nodes
     in the 'nodes' collection.
+
+    ``project_id`` is set on nodes created by a project scan, so they can
+    be looked up per project through an index instead of edges.
     """
     node_type: str
+    project_id: Optional[str] = None
 
 class BaseEdge(ArangoBase):
     """
@@ -1,7 +1,18 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class NodePosition(BaseModel):
+    # Immutable so one instance can safely be shared between a node and
+    # the edges that point at it
+    model_config = ConfigDict(frozen=True)
+
     line_no: int
     col_offset: int
     end_line_no: int
     end_col_offset: int
+
+
+# Files and folders have no source span. NodePosition is immutable, so one
+# instance is shared by every ContainsEdge instead of validating a new one.
+ZERO_POSITION = NodePosition(
+    line_no=0, col_offset=0, end_line_no=0, end_col_offset=0
+)
@@ -24,6 +24,28 @@ def test_create_function():
     )
 
     assert len(main_file.get_functions()) == 1
+
+
+def test_get_children_groups_functions_and_classes():
+    manager = CodeGraphManager()
+    project = manager.create_project(name="test", path="/path/to/project")
+    main_file = project.add_file(
+        file_name="main.py", 
+        file_path=project.absolute_path + "/"
+    )
+    position = NodePosition(
+        line_no=1, 
+        col_offset=0, 
+        end_line_no=2, 
+        end_col_offset=0
+    )
+    main_file.add_function(name="run", position=position)
+    main_file.add_class(name="App", position=position)
+
+    functions, classes = main_file.get_children()
+
+    assert [f.model.name for f in functions] == ["run"]
+    assert [c.model.name for c in classes] == ["App"]
     
 
 def test_create_function_with_inputs_and_outputs(created_function):
@@ -46,6 +46,9 @@ def test_scan_project_declaration_pass(sample_project_path):
     # Functions (7): start_app, MainApp.run, MainApp.__init__, helper_function, 
     #                UtilityClass.do_something, User.__init__, User.get_name
     assert len(all_nodes) == 1 + 5 + 3 + 7 + 1, "Should create the correct number of nodes"
+    assert collections.nodes.count() == len(all_nodes)
+    assert collections.nodes.count({"node_type": "class"}) == 3
+    assert collections.nodes.count({"node_type": "function"}) == 7
 
     # Find specific nodes by their qualified name (qname)
     main_app_node = collections.nodes.find_one({"qname": "main.MainApp"})
@@ -108,3 +111,21 @@ def test_tree_structure(sample_project_path):
 
     helper_func = utils_file.get_functions()[0]
     assert (helper_func.name == "helper_function")
+
+
+@pytest.mark.parametrize("parse_workers", [None, 2])
+def test_scan_skips_file_that_fails_to_parse(tmp_path, parse_workers):
+    """
+    A file that makes ast.parse raise RecursionError is skipped without
+    aborting the scan, both serially and with worker processes.
+    """
+    (tmp_path / "good.py").write_text("def helper():\n    pass\n")
+    (tmp_path / "deep.py").write_text(
+        "def f():\n    return " + " + ".join(["a"] * 5000) + "\n"
+    )
+
+    scanner = ProjectScanner(str(tmp_path), parse_workers=parse_workers)
+    scanner.scan()
+
+    assert collections.nodes.find_one({"qname": "good.helper"}) is not None
+    assert collections.nodes.find_one({"qname": "deep.f"}) is None
@@ -0,0 +1,81 @@
+import ast
+import pytest
+from app.core.parser.python.ast_cache import ASTCache
+
+
+def test_parse_caches_tree_in_memory():
+    cache = ASTCache()
+    tree = cache.parse("module.py", "x = 1\n")
+
+    assert isinstance(tree, ast.Module)
+    assert cache.get("module.py") is tree
+
+
+def test_persistent_cache_skips_reparse_of_unchanged_source(tmp_path):
+    source = "def foo():\n    return 1\n"
+
+    first = ASTCache(cache_dir=tmp_path)
+    first.parse("module.py", source)
+    assert (first.hits, first.misses) == (0, 1)
+    assert len(list(tmp_path.glob("*/*.pkl"))) == 1
+
+    second = ASTCache(cache_dir=tmp_path)
+    tree = second.parse("module.py", source)
+    assert (second.hits, second.misses) == (1, 0)
+    assert second.hit_rate == 1.0
+    assert ast.dump(tree) == ast.dump(ast.parse(source))
+
+    second.parse("module.py", source + "x = 2\n")
+    assert second.misses == 1
+
+
+def test_persistent_cache_does_not_store_syntax_errors(tmp_path):
+    cache = ASTCache(cache_dir=tmp_path)
+
+    with pytest.raises(SyntaxError):
+        cache.parse("broken.py", "def broken(:\n")
+    assert list(tmp_path.glob("*/*.pkl")) == []
+
+
+def test_parse_accepts_bytes_with_encoding_declaration():
+    source = "# -*- coding: latin-1 -*-\nname = 'caf\xe9'\n".encode("latin-1")
+    cache = ASTCache()
+
+    tree = cache.parse("latin.py", source)
+
+    assert tree.body[0].value.value == "caf\xe9"
+
+
+def test_clear_drops_one_or_all_trees():
+    cache = ASTCache()
+    cache.parse("a.py", "a = 1\n")
+    cache.parse("b.py", "b = 1\n")
+
+    cache.clear("a.py")
+    assert cache.cached_files() == ["b.py"]
+
+    cache.clear()
+    assert cache.cached_files() == []
+
+
+def test_maxsize_evicts_least_recently_used_tree():
+    cache = ASTCache(maxsize=2)
+    cache.parse("a.py", "a = 1\n")
+    cache.parse("b.py", "b = 1\n")
+
+    cache.get("a.py")
+    cache.parse("c.py", "c = 1\n")
+
+    assert cache.cached_files() == ["a.py", "c.py"]
+
+
+def test_persistent_cache_returns_tree_it_cannot_pickle(tmp_path):
+    # Deep enough for ast.parse but past pickle's recursion limit
+    source = "x = " + " + ".join(["'a'"] * 900) + "\n"
+
+    cache = ASTCache(cache_dir=tmp_path)
+    tree = cache.parse("deep.py", source)
+
+    assert isinstance(tree, ast.Module)
+    assert cache.get("deep.py") is tree
+    assert list(tmp_path.glob("*/*")) == []
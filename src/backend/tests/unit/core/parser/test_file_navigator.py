@@ -1,6 +1,8 @@
 import os
+from collections import OrderedDict
 import shutil
 import pytest
+from app.core.parser import file_navigator
 from app.core.parser.file_navigator import FileNavigator
 from pathlib import Path
 
@@ -29,3 +31,63 @@ def test_file_navigator_finds_python_files():
     assert "models.py" in file_names
     assert "__init__.py" in file_names
 
+
+def test_file_navigator_prunes_ignored_directories(tmp_path):
+    (tmp_path / "v-noc.toml").write_text(
+        '[ignore]\npatterns = ["build/", ".venv/"]\n'
+    )
+    (tmp_path / "app.py").write_text("")
+    for ignored in ("build", ".venv/lib", "src/build"):
+        (tmp_path / ignored).mkdir(parents=True)
+        (tmp_path / ignored / "generated.py").write_text("")
+    (tmp_path / "src" / "module.py").write_text("")
+
+    navigator = FileNavigator(tmp_path, "v-noc.toml")
+    python_files = navigator.find_files(extensions=['.py'])
+
+    relative = sorted(
+        Path(p).relative_to(tmp_path).as_posix() for p in python_files
+    )
+    assert relative == ["app.py", "src/module.py"]
+
+
+def test_file_navigator_fused_matcher_agrees_with_pathspec(tmp_path):
+    (tmp_path / "v-noc.toml").write_text(
+        '[ignore]\npatterns = ["build/", "*.pyc", "src/*.md", "**/cache"]\n'
+    )
+    navigator = FileNavigator(tmp_path, "v-noc.toml")
+
+    for path in [
+        "build/", "pkg/build/", "a.pyc", "pkg/a.pyc", "src/readme.md",
+        "docs/readme.md", "x/cache", "x/cache/", "main.py", "builder/",
+    ]:
+        assert navigator._is_ignored(path) == navigator.spec.match_file(path), path
+
+
+def test_file_navigator_reloads_spec_when_ignore_file_changes(tmp_path):
+    ignore_file = tmp_path / "v-noc.toml"
+    ignore_file.write_text('[ignore]\npatterns = ["build/"]\n')
+    first = FileNavigator(tmp_path, "v-noc.toml")
+    assert FileNavigator(tmp_path, "v-noc.toml").spec is first.spec
+
+    ignore_file.write_text('[ignore]\npatterns = ["dist/"]\n')
+    mtime = ignore_file.stat().st_mtime_ns + 1_000_000
+    os.utime(ignore_file, ns=(mtime, mtime))
+
+    changed = FileNavigator(tmp_path, "v-noc.toml")
+    assert changed.spec.match_file("dist/")
+    assert not changed.spec.match_file("build/")
+
+
+def test_file_navigator_spec_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_navigator, "SPEC_CACHE_SIZE", 2)
+    monkeypatch.setattr(FileNavigator, "_spec_cache", OrderedDict())
+    roots = []
+    for name in ("a", "b", "c"):
+        root = tmp_path / name
+        root.mkdir()
+        (root / "v-noc.toml").write_text('[ignore]\npatterns = ["build/"]\n')
+        FileNavigator(root, "v-noc.toml")
+        roots.append(str(root / "v-noc.toml"))
+
+    assert list(FileNavigator._spec_cache) == roots[1:]
@@ -0,0 +1,70 @@
+import mmap
+from app.core.parser.python import file_parser
+from app.core.parser.python.file_parser import (
+    MMAP_THRESHOLD, PythonFileParser, read_source
+)
+from app.core.parser.python.ast_cache import ASTCache
+from app.core.parser.python.symbol_table import SymbolTable
+
+
+def test_read_source_returns_bytes_for_small_files(tmp_path):
+    path = tmp_path / "small.py"
+    path.write_text("x = 1\n")
+
+    with read_source(str(path)) as content:
+        assert content == b"x = 1\n"
+
+
+def test_read_source_maps_large_files(tmp_path):
+    path = tmp_path / "large.py"
+    line = "value = 1\n"
+    path.write_text(line * (MMAP_THRESHOLD // len(line) + 1))
+
+    with read_source(str(path)) as content:
+        assert isinstance(content, mmap.mmap)
+        tree = ASTCache().parse(str(path), content)
+
+    assert len(tree.body) == MMAP_THRESHOLD // len(line) + 1
+
+
+def test_parse_many_threaded_matches_serial(tmp_path, monkeypatch):
+    (tmp_path / "a.py").write_text("class A:\n    def run(self):\n        pass\n")
+    (tmp_path / "b.py").write_text("def broken(:\n")
+    (tmp_path / "c.py").write_text("def helper():\n    pass\n")
+    # Deep enough that ast.parse raises RecursionError
+    (tmp_path / "d.py").write_text("x = " + " + ".join(["a"] * 5000) + "\n")
+    paths = [
+        str(tmp_path / name)
+        for name in ("a.py", "b.py", "missing.py", "d.py", "c.py")
+    ]
+
+    def run():
+        parser = PythonFileParser(ASTCache(), SymbolTable(), str(tmp_path))
+        return [
+            (path, None if nodes is None else [n.qname for n in nodes])
+            for path, nodes in parser.parse_many(paths)
+        ]
+
+    serial = run()
+    monkeypatch.setattr(file_parser, "FREE_THREADED", True)
+    assert run() == serial
+    assert [nodes for _, nodes in serial] == [
+        ["a.A", "a.A.run"], [], None, None, ["c.helper"]
+    ]
+
+
+def test_parse_declarations_skips_file_that_fails(tmp_path, monkeypatch):
+    path = tmp_path / "a.py"
+    path.write_text("def helper():\n    pass\n")
+
+    def fail(self, file_path, content):
+        raise RecursionError("maximum recursion depth exceeded")
+
+    monkeypatch.setattr(PythonFileParser, "run_declaration_pass", fail)
+
+    assert file_parser.parse_declarations(
+        str(tmp_path), None, str(path)
+    ) == (str(path), None)
+    assert file_parser.parse_declarations(
+        str(tmp_path), None, str(tmp_path / "missing.py")
+    ) == (str(tmp_path / "missing.py"), None)
@@ -24,3 +24,37 @@ def test_get_project(create_project):
     assert loaded_project.get_files() == []
     assert loaded_project.get_folders() == []
     
+
+def test_load_project_is_cached(create_project):
+    project = create_project
+
+    manager = CodeGraphManager()
+    first = manager.load_project(project_key=project.key)
+    second = manager.load_project(project_key=project.key)
+    assert first is second
+
+    manager = CodeGraphManager(project_cache_ttl=0)
+    first = manager.load_project(project_key=project.key)
+    second = manager.load_project(project_key=project.key)
+    assert first is not second
+    assert first.key == second.key
+
+def test_project_cache_is_bounded():
+    manager = CodeGraphManager(project_cache_size=2)
+    first = manager.create_project(name="first", path="/path/to/first")
+    manager.create_project(name="second", path="/path/to/second")
+    manager.create_project(name="third", path="/path/to/third")
+
+    assert len(manager._project_cache) == 2
+    assert first.key not in manager._project_cache
+    assert manager.load_project(project_key=first.key).name == "first"
+
+def test_invalidate_project_forces_reload(create_project):
+    project = create_project
+
+    manager = CodeGraphManager()
+    first = manager.load_project(project_key=project.key)
+    manager.invalidate_project(project.key)
+    second = manager.load_project(project_key=project.key)
+    assert first is not second
+    assert second.key == project.key
@@ -0,0 +1,14 @@
+from app.core.qname import path_to_qname
+
+
+def test_path_to_qname_strips_base_and_suffix():
+    assert path_to_qname("/project/src/utils/helper.py", "/project") == "src.utils.helper"
+    assert path_to_qname("/project/src/utils", "/project", strip_suffix=False) == "src.utils"
+
+
+def test_path_to_qname_only_drops_trailing_py_suffix():
+    assert path_to_qname("/project/my.pyramid/mod.pyx", "/project") == "my.pyramid.mod.pyx"
+
+
+def test_path_to_qname_leaves_unrelated_base_untouched():
+    assert path_to_qname("src/main.py", "/elsewhere") == "src.main"